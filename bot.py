@@ -19,6 +19,11 @@ from notifications import drain_queue
 from utils.logger import get_logger
 from utils.sentry import init_sentry
 
+try:  # pragma: no cover - exercised implicitly where uvloop is installed
+    import uvloop  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from backup_service import BackupService
     from notifications import NotificationService
@@ -315,6 +320,20 @@ async def _start_polling_with_retries(
                 await asyncio.sleep(backoff_delay)
 
 
+def install_event_loop_policy() -> bool:
+    """Switch asyncio to uvloop when it is installed and not disabled.
+
+    Set ``SPRINT_BOT_UVLOOP=0`` to keep the default event loop.
+    """
+
+    if uvloop is None:
+        return False
+    if os.getenv("SPRINT_BOT_UVLOOP", "1").strip().lower() in {"0", "false", "no"}:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 async def main() -> None:
     """Start Sprint Bot."""
     logger.info("[SprintBot] starting…")
@@ -402,4 +421,6 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    if install_event_loop_policy():
+        logger.info("Using uvloop event loop")
     asyncio.run(main())
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-from i18n import t
+from functools import lru_cache
+
+from i18n import get_current_language, t
 from sprint_bot.domain.analytics import avg_speed
 from utils import fmt_time
 
 
-def build_quick_prompt(idx: int, length: float) -> str:
-    """Return localized prompt for collecting a segment time."""
-
+@lru_cache(maxsize=128)
+def _quick_prompt(idx: int, length: float, lang: str) -> str:
     distance = f"{length:g}"
-    prompt = t("add.quick.prompt", idx=idx + 1, distance=distance)
-    example = t("add.quick.example")
+    prompt = t("add.quick.prompt", idx=idx + 1, distance=distance, lang=lang)
+    example = t("add.quick.example", lang=lang)
     return f"{prompt}\n{example}"
 
 
+def build_quick_prompt(idx: int, length: float) -> str:
+    """Return localized prompt for collecting a segment time.
+
+    Prompts are cached per segment, length and language.
+    """
+
+    return _quick_prompt(idx, length, get_current_language())
+
+
 def build_quick_saved(dist: int, total: float) -> str:
     """Return localized summary header for a saved result."""
 
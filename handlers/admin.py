@@ -125,7 +125,7 @@ async def _sync_all_services(
         query_service.init(),
         io_service.init(),
     )
-    dataset = get_registered_athletes()
+    dataset = await asyncio.to_thread(get_registered_athletes)
     if dataset:
         await role_service.bulk_sync_athletes(tuple(dataset))
     return len(dataset)
@@ -423,7 +423,7 @@ async def import_athletes_command(
         await message.bot.download(document, destination=buffer)
         dataset = _parse_athlete_csv(buffer.getvalue())
     else:
-        dataset = list(get_registered_athletes())
+        dataset = await asyncio.to_thread(get_registered_athletes)
 
     if not dataset:
         await message.answer(t("admin.tools.import_empty", badge=t(_DEBUG_BADGE_KEY)))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 
 from aiogram import Router, types
@@ -7,7 +8,7 @@ from aiogram.filters import Command
 from aiogram.types import KeyboardButton, ReplyKeyboardMarkup
 
 from role_service import ROLE_ADMIN, ROLE_ATHLETE, ROLE_TRAINER, RoleService
-from services import get_athletes_worksheet
+from services import athletes_cache, get_athletes_worksheet
 from utils.roles import require_roles
 
 router = Router()
@@ -50,17 +51,19 @@ async def reg_contact(message: types.Message, role_service: RoleService) -> None
         return
 
     try:
-        worksheet.append_row(
+        await asyncio.to_thread(
+            worksheet.append_row,
             [
                 contact.user_id,
                 contact.first_name or "",
                 datetime.now(timezone.utc).isoformat(" ", "seconds"),
-            ]
+            ],
         )
     except Exception:
         return await message.answer(
             "Помилка при збереженні контакту. Спробуйте пізніше."
         )
+    athletes_cache.invalidate()
     await role_service.set_role(contact.user_id, ROLE_ATHLETE)
     await role_service.upsert_user(contact)
     await message.answer(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from aiogram import Router, types
@@ -59,7 +60,7 @@ async def cmd_team_progress(message: types.Message, role_service: RoleService) -
         await message.answer(t("error.forbidden"))
         return
 
-    profiles = _load_profiles()
+    profiles = await asyncio.to_thread(_load_profiles)
     group_filter = options.get("group")
     club_filter = options.get("club")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from html import escape
@@ -152,7 +153,7 @@ async def _show_threads(
         accessible_ids = set(await role_service.get_accessible_athletes(user_id))
         athletes = [
             (athlete_id, name)
-            for athlete_id, name in get_registered_athletes()
+            for athlete_id, name in await asyncio.to_thread(get_registered_athletes)
             if athlete_id in accessible_ids
         ]
     else:
@@ -26,7 +26,7 @@ from keyboards import (
     get_onboarding_skip_keyboard,
 )
 from role_service import ROLE_ATHLETE, ROLE_TRAINER, RoleService
-from services import get_athletes_worksheet
+from services import athletes_cache, get_athletes_worksheet
 from services.user_service import UserProfile, UserService
 from utils.personal_data import mask_identifier
 
@@ -162,6 +162,8 @@ async def _append_athlete_row(user_id: int, name: str) -> None:
         )
     except Exception as exc:  # pragma: no cover - external dependency
         logger.warning("Failed to append athlete %s to worksheet: %s", user_id, exc)
+        return
+    athletes_cache.invalidate()
 
 
 async def _proceed_to_group(state: FSMContext, message: Message) -> None:
@@ -17,7 +17,7 @@ from keyboards import build_analysis_keyboard
 from role_service import ROLE_ADMIN, ROLE_ATHLETE, ROLE_TRAINER, RoleService
 from services import get_athletes_worksheet, get_results_worksheet
 from services.stats_service import StatsPeriod, StatsService, TurnProgressResult
-from utils import fmt_time
+from utils import fmt_time, sheet_float
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa: E402  # isort:skip
@@ -157,7 +157,7 @@ def _parse_results(
         try:
             dist = int(row[3])
             timestamp = datetime.fromisoformat(row[4])
-            total = float(str(row[6]).replace(",", "."))
+            total = sheet_float(row[6])
         except (ValueError, IndexError):
             logger.warning("Skipping malformed result row: %s", row)
             continue
@@ -397,7 +397,7 @@ async def _send_progress_report(
 
     try:
         worksheet = get_results_worksheet()
-        raw_rows = worksheet.get_all_values()
+        raw_rows = await asyncio.to_thread(worksheet.get_all_values)
     except RuntimeError as exc:
         logger.error("Failed to access results worksheet: %s", exc, exc_info=True)
         target = event.message if isinstance(event, types.CallbackQuery) else event
@@ -524,7 +524,7 @@ async def cmd_progress(
 
     try:
         worksheet = get_athletes_worksheet()
-        records = worksheet.get_all_records()
+        records = await asyncio.to_thread(worksheet.get_all_records)
     except RuntimeError as exc:
         logger.error("Failed to access athletes worksheet: %s", exc, exc_info=True)
         await message.answer(
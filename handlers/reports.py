@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -16,7 +17,7 @@ from i18n import t
 from reports import AttemptReport, SegmentReportRow, generate_image_report
 from role_service import RoleService
 from services import get_pr_worksheet, get_results_worksheet
-from utils import get_segments
+from utils import get_segments, sheet_float
 
 router = Router()
 
@@ -100,8 +101,8 @@ def _parse_row(row: Sequence[str]) -> ResultPayload | None:
     except json.JSONDecodeError:
         return None
     try:
-        splits = [float(str(value).replace(",", ".")) for value in splits]
-        total = float(str(total_raw).replace(",", "."))
+        splits = [sheet_float(value) for value in splits]
+        total = sheet_float(total_raw)
     except (TypeError, ValueError):
         return None
     return ResultPayload(
@@ -194,7 +195,7 @@ def _load_segment_bests(
         if uid != athlete_id or stroke_key != stroke or dist_val != distance:
             continue
         try:
-            value = float(str(row[1]).replace(",", "."))
+            value = sheet_float(row[1])
         except (TypeError, ValueError):
             continue
         timestamp = str(row[2]) if len(row) > 2 and row[2] else None
@@ -229,14 +230,23 @@ async def cmd_report_last(message: types.Message, role_service: RoleService) ->
         await message.answer(build_report_error("forbidden"))
         return
 
-    payload = _load_last_result(target_id)
+    payload = await asyncio.to_thread(_load_last_result, target_id)
     if payload is None:
         await message.answer(build_report_error("no_results"))
         return
 
     lengths = _resolve_segment_lengths(payload.distance, len(payload.splits))
-    segment_bests = _load_segment_bests(
-        payload.athlete_id, payload.stroke, payload.distance, len(payload.splits)
+    segment_bests, best_total = await asyncio.gather(
+        asyncio.to_thread(
+            _load_segment_bests,
+            payload.athlete_id,
+            payload.stroke,
+            payload.distance,
+            len(payload.splits),
+        ),
+        asyncio.to_thread(
+            _load_best_total, payload.athlete_id, payload.stroke, payload.distance
+        ),
     )
     rows: list[SegmentReportRow] = []
     for idx, split in enumerate(payload.splits):
@@ -247,7 +257,6 @@ async def cmd_report_last(message: types.Message, role_service: RoleService) ->
     sob_flag = any(
         ts and ts == payload.timestamp for _, ts in segment_bests[: len(payload.splits)]
     )
-    best_total = _load_best_total(payload.athlete_id, payload.stroke, payload.distance)
     total_flag = best_total is not None and abs(payload.total - best_total) <= 1e-6
 
     attempt = AttemptReport(
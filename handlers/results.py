@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Dict, Iterable, Sequence, Tuple
 
@@ -14,7 +15,7 @@ from keyboards import AnalysisCB
 from role_service import ROLE_ADMIN, RoleService
 from services import get_pr_worksheet, get_results_worksheet
 from services.export_service import ExportService
-from utils import fmt_time
+from utils import fmt_time, sheet_float
 
 router = Router()
 
@@ -59,7 +60,7 @@ def _collect_best_totals_bulk(
         if uid not in totals_map:
             continue
         try:
-            total = float(str(total_raw).replace(",", "."))
+            total = sheet_float(total_raw)
         except (TypeError, ValueError):
             continue
         key = (stroke, dist)
@@ -104,7 +105,7 @@ def _collect_segment_bests(athlete_id: int) -> Dict[RecordKey, Dict[int, float]]
         if uid != athlete_id:
             continue
         try:
-            value = float(str(row[1]).replace(",", "."))
+            value = sheet_float(row[1])
         except (TypeError, ValueError):
             continue
         record_key = (stroke, dist)
@@ -280,8 +281,10 @@ async def cmd_best(message: types.Message, role_service: RoleService) -> None:
         await message.answer(t("error.forbidden"))
         return
 
-    totals = _collect_best_totals(target_id)
-    segment_bests = _collect_segment_bests(target_id)
+    totals, segment_bests = await asyncio.gather(
+        asyncio.to_thread(_collect_best_totals, target_id),
+        asyncio.to_thread(_collect_segment_bests, target_id),
+    )
     if not totals and not segment_bests:
         await message.answer(t("error.not_found"))
         return
@@ -328,7 +331,7 @@ async def cmd_show_sob(message: types.Message, role_service: RoleService) -> Non
         await message.answer(t("error.forbidden"))
         return
 
-    segments = _collect_segment_bests(target_id)
+    segments = await asyncio.to_thread(_collect_segment_bests, target_id)
     athlete_name = await _resolve_athlete_name(role_service, target_id)
     text = _format_sob_summary(segments, athlete_name, target_id)
     await message.answer(text, parse_mode="HTML")
@@ -402,7 +405,7 @@ async def handle_analysis_callback(
             )
 
     if action == "pb":
-        totals = _collect_best_totals(athlete_id)
+        totals = await asyncio.to_thread(_collect_best_totals, athlete_id)
         await _send_text(
             _format_pb_summary(totals, athlete_name, athlete_id), html=True
         )
@@ -410,7 +413,7 @@ async def handle_analysis_callback(
         return
 
     if action == "sob":
-        segments = _collect_segment_bests(athlete_id)
+        segments = await asyncio.to_thread(_collect_segment_bests, athlete_id)
         await _send_text(
             _format_sob_summary(segments, athlete_name, athlete_id), html=True
         )
@@ -420,7 +423,9 @@ async def handle_analysis_callback(
     if action == "compare":
         accessible = set(await role_service.get_accessible_athletes(cb.from_user.id))
         accessible.discard(athlete_id)
-        text = _build_team_comparison(athlete_id, athlete_name, accessible)
+        text = await asyncio.to_thread(
+            _build_team_comparison, athlete_id, athlete_name, accessible
+        )
         await _send_text(text, html=True)
         await cb.answer()
         return
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any, Mapping, Sequence
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+from typing import Any, Final, Mapping, Sequence
 
 from aiogram import F, Router, types
 from aiogram.filters import Command
@@ -23,12 +24,13 @@ from keyboards import (
 from role_service import ROLE_ATHLETE, RoleService
 from services.query_service import QueryService, SearchFilters, SearchPage
 from utils import fmt_time
+from utils.fsm import advance_state
 
 router = Router()
 
-PAGE_SIZE = 5
+PAGE_SIZE: Final = 5
 
-STYLE_VALUES: Sequence[str] = (
+STYLE_VALUES: Final[Sequence[str]] = (
     "any",
     "freestyle",
     "backstroke",
@@ -37,27 +39,39 @@ STYLE_VALUES: Sequence[str] = (
     "medley",
 )
 
-STYLE_LABEL_KEYS: Mapping[str, str] = {
-    "any": "search.style.any",
-    "freestyle": "search.style.freestyle",
-    "backstroke": "search.style.backstroke",
-    "butterfly": "search.style.butterfly",
-    "breaststroke": "search.style.breaststroke",
-    "medley": "search.style.medley",
-}
-
-SKIP_TOKENS = {
-    "-",
-    "skip",
-    "any",
-    "пропустити",
-    "пропустить",
-    "будь-яка",
-    "любая",
-    "любой",
-}
+STYLE_LABEL_KEYS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "any": "search.style.any",
+        "freestyle": "search.style.freestyle",
+        "backstroke": "search.style.backstroke",
+        "butterfly": "search.style.butterfly",
+        "breaststroke": "search.style.breaststroke",
+        "medley": "search.style.medley",
+    }
+)
+
+SKIP_TOKENS: Final = frozenset(
+    {
+        "-",
+        "skip",
+        "any",
+        "пропустити",
+        "пропустить",
+        "будь-яка",
+        "любая",
+        "любой",
+    }
+)
 
-DISTANCE_VALUES: Sequence[str] = ("any", "50", "100", "200", "400", "800", "1500")
+DISTANCE_VALUES: Final[Sequence[str]] = (
+    "any",
+    "50",
+    "100",
+    "200",
+    "400",
+    "800",
+    "1500",
+)
 
 
 def _stroke_label(value: str) -> str:
@@ -132,7 +146,9 @@ async def start_search(
 
     default_athlete_label = all_label if include_all else options[0][1]
 
-    await state.update_data(
+    await advance_state(
+        state,
+        SearchStates.choose_athlete,
         athlete_id=None,
         athlete_label=default_athlete_label,
         athlete_labels={value: label for value, label in options},
@@ -147,7 +163,6 @@ async def start_search(
     )
 
     await message.answer(t("search.prompt.athlete"), reply_markup=keyboard)
-    await state.set_state(SearchStates.choose_athlete)
 
 
 @router.callback_query(
@@ -177,12 +192,13 @@ async def select_athlete(
             athlete_id = None
         label = labels.get(value, f"ID {value}")
 
-    await state.update_data(athlete_id=athlete_id, athlete_label=label)
+    await advance_state(
+        state, SearchStates.choose_style, athlete_id=athlete_id, athlete_label=label
+    )
     await callback.message.answer(
         t("search.prompt.style"),
         reply_markup=build_search_style_keyboard(_style_choices()),
     )
-    await state.set_state(SearchStates.choose_style)
 
 
 @router.callback_query(
@@ -202,12 +218,13 @@ async def select_style(
         stroke = value
         label = _stroke_label(value)
 
-    await state.update_data(stroke=stroke, stroke_label=label)
+    await advance_state(
+        state, SearchStates.choose_distance, stroke=stroke, stroke_label=label
+    )
     await callback.message.answer(
         t("search.prompt.distance"),
         reply_markup=build_search_distance_keyboard(_distance_choices()),
     )
-    await state.set_state(SearchStates.choose_distance)
 
 
 @router.callback_query(
@@ -229,11 +246,12 @@ async def select_distance(
             distance = None
     label = _distance_label(distance)
 
-    await state.update_data(distance=distance, distance_label=label)
+    await advance_state(
+        state, SearchStates.enter_dates, distance=distance, distance_label=label
+    )
     await callback.message.answer(
         t("search.prompt.dates"),
     )
-    await state.set_state(SearchStates.enter_dates)
 
 
 @router.message(SearchStates.enter_dates)
@@ -247,12 +265,17 @@ async def input_dates(message: types.Message, state: FSMContext) -> None:
         await message.answer(t("search.error.range"))
         return
 
-    await state.update_data(date_from=date_from, date_to=date_to, date_label=label)
+    await advance_state(
+        state,
+        SearchStates.choose_pr,
+        date_from=date_from,
+        date_to=date_to,
+        date_label=label,
+    )
     await message.answer(
         t("search.prompt.pr"),
         reply_markup=build_search_pr_keyboard(),
     )
-    await state.set_state(SearchStates.choose_pr)
 
 
 @router.callback_query(SearchStates.choose_pr, SearchFilterCB.filter(F.field == "pr"))
@@ -267,14 +290,19 @@ async def select_pr(
     await callback.answer()
     value = callback_data.value
     only_pr = value == "only"
-    await state.update_data(only_pr=only_pr)
 
     data = await state.get_data()
+    data["only_pr"] = only_pr
     filters = _filters_from_state(data)
+    if not _can_have_results(filters, data):
+        await advance_state(state, SearchStates.browsing, only_pr=only_pr)
+        await callback.message.answer(t("search.empty"))
+        return
+
     page = await query_service.search_results(filters, page=1, page_size=PAGE_SIZE)
     if page.total == 0:
+        await advance_state(state, SearchStates.browsing, only_pr=only_pr)
         await callback.message.answer(t("search.empty"))
-        await state.set_state(SearchStates.browsing)
         return
 
     text = _format_results(page, data)
@@ -284,9 +312,14 @@ async def select_pr(
         total_pages=page.pages,
         start_index=(page.page - 1) * PAGE_SIZE,
     )
+    await advance_state(
+        state,
+        SearchStates.browsing,
+        only_pr=only_pr,
+        last_page=page.page,
+        total_pages=page.pages,
+    )
     await callback.message.answer(text, reply_markup=markup)
-    await state.update_data(last_page=page.page, total_pages=page.pages)
-    await state.set_state(SearchStates.browsing)
 
 
 @router.callback_query(SearchStates.browsing, SearchPageCB.filter())
@@ -370,6 +403,24 @@ def _filters_from_state(data: Mapping[str, Any]) -> SearchFilters:
     )
 
 
+def _can_have_results(filters: SearchFilters, data: Mapping[str, Any]) -> bool:
+    """Return ``False`` when filters obviously cannot match any result."""
+
+    labels = data.get("athlete_labels")
+    if (
+        filters.athlete_id is not None
+        and isinstance(labels, Mapping)
+        and labels
+        and str(filters.athlete_id) not in labels
+    ):
+        return False
+    # Results are stored with UTC timestamps and filtered by their UTC date
+    today = datetime.now(timezone.utc).date()
+    if filters.date_from is not None and filters.date_from > today:
+        return False
+    return True
+
+
 def _filters_summary(data: Mapping[str, Any]) -> str:
     athlete = data.get("athlete_label") or t("search.filter.all_users")
     stroke = data.get("stroke_label") or _stroke_label("any")
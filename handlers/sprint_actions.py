@@ -11,11 +11,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import html
 import json
 import logging
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Iterable, Sequence
+from itertools import islice
+from typing import Any, Awaitable, Iterable, Sequence
 
 from aiogram import F, Router, types
 from aiogram.filters import Command
@@ -24,11 +29,13 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from i18n import t
 from keyboards import (
+    AthleteSelectCB,
     CommentCB,
     DistanceCB,
     RepeatCB,
     StrokeCB,
     TemplateCB,
+    get_athlete_select_keyboard,
     get_comment_prompt_keyboard,
     get_distance_keyboard,
     get_result_actions_keyboard,
@@ -46,17 +53,22 @@ from menu_callbacks import (
 from notifications import NotificationService
 from role_service import ROLE_ATHLETE, ROLE_TRAINER, RoleService
 from services import (
-    get_athletes_worksheet,
     get_log_worksheet,
     get_pr_worksheet,
     get_results_worksheet,
 )
+from services.athletes_cache import get_athletes
+from services.sheet_cache import SheetSnapshot
 from services.stats_service import SobStats, calc_segment_prs, calc_sob, calc_total_pr
 from sprint_bot.domain.analytics import avg_speed as calc_avg_speed
-from sprint_bot.domain.analytics import degradation_percent as calc_degradation
-from sprint_bot.domain.analytics import pace_per_100, segment_speeds
+from sprint_bot.domain.analytics import (
+    pace_per_100,
+    segment_speeds,
+    speed_degradation,
+)
 from template_service import SprintTemplate, TemplateService
-from utils import AddResult, fmt_time, get_segments, pr_key
+from utils import AddResult, fmt_time, get_segments, pr_key, sheet_float
+from utils.fsm import advance_state
 from utils.parse_time import parse_splits, parse_total, validate_splits
 
 from .add_result import build_quick_prompt, build_quick_saved
@@ -64,11 +76,30 @@ from .add_result import build_quick_prompt, build_quick_saved
 router = Router()
 
 
-# (coach_id, athlete_id) -> stored data for quick repeat
-LAST_RESULTS: dict[tuple[int, int], dict[str, Any]] = {}
+# (coach_id, athlete_id) -> stored data for quick repeat, least recent first
+LAST_RESULTS: OrderedDict[tuple[int, int], dict[str, Any]] = OrderedDict()
+LAST_RESULTS_LIMIT = 1024
+
+# timestamp -> payloads from LAST_RESULTS sharing that result
+LAST_BY_TS: dict[str, list[dict[str, Any]]] = {}
 
 COMMENT_COLUMN_INDEX = 8
 
+# Telegram rejects messages over 4096 characters; keep some headroom
+MESSAGE_CHUNK_LIMIT = 4000
+
+HISTORY_LIMIT = 10
+HISTORY_SEPARATOR = "-" * 20
+
+_format_speed = "{:.2f} м/с".format
+
+_PERSIST_LOCK = threading.Lock()
+
+# Audit log rows are written in order by a single background thread
+_LOG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheet-log")
+
+_WARMUP_TASK: asyncio.Task[None] | None = None
+
 
 def _normalize_comment(comment: str | None) -> str:
     """Return trimmed comment or empty string."""
@@ -84,6 +115,24 @@ def _comment_to_html(comment: str) -> str:
     return html.escape(comment, quote=True)
 
 
+def _message_chunks(
+    blocks: Iterable[str], sep: str = "\n\n", limit: int = MESSAGE_CHUNK_LIMIT
+) -> list[str]:
+    """Pack text blocks into messages of at most ``limit`` characters."""
+
+    chunks: list[str] = []
+    current = ""
+    for block in blocks:
+        if current and len(current) + len(sep) + len(block) > limit:
+            chunks.append(current)
+            current = block
+        else:
+            current = f"{current}{sep}{block}" if current else block
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 def _results_sheet():
     """Return worksheet with sprint results."""
 
@@ -102,24 +151,123 @@ def _log_sheet():
     return get_log_worksheet()
 
 
-def _athletes_sheet():
-    """Return worksheet with athlete records."""
+# Shared snapshots so one save reads each worksheet at most once
+_RESULTS_SNAPSHOT = SheetSnapshot(lambda: _results_sheet())
+_PR_SNAPSHOT = SheetSnapshot(lambda: _pr_sheet())
+
+
+async def warm_caches() -> None:
+    """Preload athletes and the result/PR snapshots concurrently.
+
+    Failures are only logged; handlers fall back to loading on demand.
+    """
+
+    outcomes = await asyncio.gather(
+        get_athletes(),
+        asyncio.to_thread(_RESULTS_SNAPSHOT.rows),
+        asyncio.to_thread(_PR_SNAPSHOT.rows),
+        return_exceptions=True,
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            logging.warning("Failed to warm sheet caches: %s", outcome)
+
+
+@router.startup()
+async def _schedule_cache_warmup() -> None:
+    """Warm caches in the background so polling starts without waiting."""
+
+    global _WARMUP_TASK
+    _WARMUP_TASK = asyncio.create_task(warm_caches(), name="sheet-cache-warmup")
+
+
+def _append_log_row(row: list[Any]) -> None:
+    """Append an audit row; runs on the log writer thread."""
+
+    try:
+        _log_sheet().append_row(row)
+    except Exception as exc:
+        logging.error("Failed to append audit log row: %s", exc, exc_info=True)
+
+
+def _read_comment(row_idx: int) -> str:
+    """Return the stored comment; blocking, run it in a thread."""
+
+    rows = _RESULTS_SNAPSHOT.rows()
+    if not 1 <= row_idx <= len(rows):
+        return _results_sheet().cell(row_idx, COMMENT_COLUMN_INDEX).value or ""
+    row = rows[row_idx - 1]
+    return row[COMMENT_COLUMN_INDEX - 1] if len(row) >= COMMENT_COLUMN_INDEX else ""
+
+
+def _parse_result_total(row: list[str]) -> tuple[tuple[int, str, int], float] | None:
+    """Map a results row to ``((athlete_id, stroke, dist), total)``."""
+
+    if len(row) < 7:
+        return None
+    key = (int(row[0]), str(row[2]), int(row[3]))
+    return key, sheet_float(row[6])
+
+
+def _parse_result_owner(row: list[str]) -> tuple[int, list[str]] | None:
+    """Map a results row to ``(athlete_id, row)``."""
+
+    if not row:
+        return None
+    return int(row[0]), row
+
+
+def _parse_result_key(row: list[str]) -> tuple[tuple[int, str], None] | None:
+    """Map a results row to ``((athlete_id, timestamp), None)``."""
+
+    if len(row) < 5:
+        return None
+    return (int(row[0]), row[4]), None
+
 
-    return get_athletes_worksheet()
+def _parse_pr_row(
+    row: list[str],
+) -> tuple[tuple[int, str, int], tuple[int, float]] | None:
+    """Map a PR row to ``((athlete_id, stroke, dist), (seg_idx, value))``.
+
+    This is the inverse of :func:`utils.pr_key`.
+    """
+
+    if len(row) < 2:
+        return None
+    uid_str, stroke_key, dist_str, seg_idx_str = row[0].split("|")
+    value = sheet_float(row[1])
+    return (int(uid_str), stroke_key, int(dist_str)), (int(seg_idx_str), value)
+
+
+def _parse_pr_owner(row: list[str]) -> tuple[int, tuple[int, float]] | None:
+    """Map a PR row to ``(athlete_id, (dist, value))``."""
+
+    parsed = _parse_pr_row(row)
+    if parsed is None:
+        return None
+    (uid, _, dist), (_, value) = parsed
+    return uid, (dist, value)
+
+
+# (athlete_id, stroke, dist) -> {row: parsed value}
+_TOTALS_BY_ATHLETE = _RESULTS_SNAPSHOT.index(_parse_result_total)
+_PRS_BY_ATHLETE = _PR_SNAPSHOT.index(_parse_pr_row)
+# athlete_id -> {row: (dist, value)}
+_PRS_BY_OWNER = _PR_SNAPSHOT.index(_parse_pr_owner)
+# athlete_id -> {row: raw results row}
+_RESULTS_BY_OWNER = _RESULTS_SNAPSHOT.index(_parse_result_owner)
+# (athlete_id, timestamp) -> {row: None}
+_RESULT_ROWS = _RESULTS_SNAPSHOT.index(_parse_result_key)
 
 
 def _find_result_row(athlete_id: int, timestamp: str) -> int:
     """Return worksheet row index for result with provided timestamp."""
 
-    rows = _results_sheet().get_all_values()
-    for idx, row in enumerate(rows, start=1):
-        if len(row) < 5:
-            continue
-        if str(row[0]) != str(athlete_id):
-            continue
-        if row[4] == timestamp:
-            return idx
-    raise ValueError("Result row not found")
+    rows = _RESULT_ROWS.get((int(athlete_id), timestamp))
+    if not rows:
+        raise ValueError("Result row not found")
+    return min(rows)
 
 
 def _update_comment(athlete_id: int, timestamp: str, comment: str | None) -> None:
@@ -128,14 +276,49 @@ def _update_comment(athlete_id: int, timestamp: str, comment: str | None) -> Non
     normalized = _normalize_comment(comment)
     row_idx = _find_result_row(athlete_id, timestamp)
     _results_sheet().update_cell(row_idx, COMMENT_COLUMN_INDEX, normalized)
+    _RESULTS_SNAPSHOT.record_cell(row_idx, COMMENT_COLUMN_INDEX, normalized)
+
+
+def _forget_last_result(payload: dict[str, Any]) -> None:
+    """Drop ``payload`` from the timestamp index."""
+
+    timestamp = payload.get("timestamp")
+    bucket = LAST_BY_TS.get(timestamp) if isinstance(timestamp, str) else None
+    if bucket is None:
+        return
+    bucket[:] = [item for item in bucket if item is not payload]
+    if not bucket:
+        del LAST_BY_TS[timestamp]
+
+
+def _remember_last_result(key: tuple[int, int], payload: dict[str, Any]) -> None:
+    """Store payload for quick repeat, evicting the least recent entries."""
+
+    previous = LAST_RESULTS.pop(key, None)
+    if previous is not None:
+        _forget_last_result(previous)
+    LAST_RESULTS[key] = payload
+    LAST_BY_TS.setdefault(payload["timestamp"], []).append(payload)
+    while len(LAST_RESULTS) > LAST_RESULTS_LIMIT:
+        _, evicted = LAST_RESULTS.popitem(last=False)
+        _forget_last_result(evicted)
+
+
+def _retime_last_result(
+    key: tuple[int, int], payload: dict[str, Any], timestamp: str
+) -> None:
+    """Move a cached payload to a new, comment-less saved result."""
+
+    _forget_last_result(payload)
+    payload.update(timestamp=timestamp, comment="")
+    _remember_last_result(key, payload)
 
 
 def _sync_last_results(timestamp: str, comment: str) -> None:
     """Update cached last results with a new comment value."""
 
-    for payload in LAST_RESULTS.values():
-        if payload.get("timestamp") == timestamp:
-            payload["comment"] = comment
+    for payload in LAST_BY_TS.get(timestamp, ()):
+        payload["comment"] = comment
 
 
 def _build_comment_edit_keyboard(
@@ -183,31 +366,11 @@ def _load_best_total(athlete_id: int, stroke: str, dist: int) -> float | None:
     """Return previous best total time for athlete if available."""
 
     try:
-        rows = _results_sheet().get_all_values()
+        totals = _TOTALS_BY_ATHLETE.get((athlete_id, stroke, dist))
     except Exception as exc:  # pragma: no cover - network dependent
         logging.warning("Failed to load previous totals: %s", exc, exc_info=True)
         return None
-
-    best: float | None = None
-    for row in rows:
-        if not row or len(row) < 7:
-            continue
-        try:
-            uid = int(row[0])
-            row_stroke = str(row[2])
-            row_dist = int(row[3])
-            total_raw = row[6]
-        except (ValueError, IndexError, TypeError):
-            continue
-        if uid != athlete_id or row_stroke != stroke or row_dist != dist:
-            continue
-        try:
-            total_value = float(str(total_raw).replace(",", "."))
-        except (TypeError, ValueError):
-            continue
-        if best is None or total_value < best:
-            best = total_value
-    return best
+    return min(totals.values(), default=None)
 
 
 def _load_segment_bests(
@@ -216,7 +379,7 @@ def _load_segment_bests(
     """Return stored best segment times and their worksheet rows."""
 
     try:
-        rows = _pr_sheet().get_all_values()
+        rows = _PRS_BY_ATHLETE.get((athlete_id, stroke, dist))
     except RuntimeError as exc:
         logging.warning("Failed to access PR worksheet: %s", exc, exc_info=True)
         return [], {}
@@ -224,35 +387,15 @@ def _load_segment_bests(
         logging.warning("Failed to load segment PRs: %s", exc, exc_info=True)
         return [], {}
 
-    values: dict[int, float] = {}
+    best_list: list[float | None] = []
     rows_map: dict[int, int] = {}
-    for row_idx, row in enumerate(rows, start=1):
-        if not row or len(row) < 2:
+    for row_idx, (seg_idx, value) in rows.items():
+        if seg_idx < 0:
             continue
-        key = row[0]
-        try:
-            uid_str, stroke_key, dist_str, seg_idx_str = key.split("|")
-            uid = int(uid_str)
-            seg_idx = int(seg_idx_str)
-            dist_val = int(dist_str)
-        except (ValueError, AttributeError):
-            continue
-        if uid != athlete_id or stroke_key != stroke or dist_val != dist:
-            continue
-        try:
-            value = float(str(row[1]).replace(",", "."))
-        except (TypeError, ValueError):
-            continue
-        values[seg_idx] = value
+        if seg_idx >= len(best_list):
+            best_list.extend([None] * (seg_idx + 1 - len(best_list)))
+        best_list[seg_idx] = value
         rows_map[seg_idx] = row_idx
-
-    if not values:
-        return [], rows_map
-
-    max_idx = max(values)
-    best_list: list[float | None] = [None] * (max_idx + 1)
-    for idx, value in values.items():
-        best_list[idx] = value
     return best_list, rows_map
 
 
@@ -264,62 +407,80 @@ def _persist_result(
     splits: Iterable[float],
     comment: str | None = None,
 ) -> tuple[float, list[tuple[int, float]], str, dict[str, Any]]:
-    """Save result to Google Sheets and return totals with PR info."""
-
-    splits_list = list(splits)
-    total = sum(splits_list)
-    validate_splits(total, splits_list)
-    timestamp = datetime.now(timezone.utc).isoformat(sep=" ", timespec="seconds")
-
-    previous_total = _load_best_total(athlete_id, stroke, dist)
-    segment_bests, segment_rows = _load_segment_bests(athlete_id, stroke, dist)
-    total_stats = calc_total_pr(previous_total, total)
-    segment_flags = calc_segment_prs(segment_bests, splits_list)
-    sob_stats: SobStats = calc_sob(segment_bests, splits_list)
-
-    stats_payload: dict[str, Any] = {
-        "new_total_pr": total_stats.is_new,
-        "total_pr_delta": total_stats.delta,
-        "previous_total": total_stats.previous,
-        "segment_prs": segment_flags,
-        "sob_delta": sob_stats.delta,
-        "sob_previous": sob_stats.previous,
-        "sob_current": sob_stats.current,
-    }
-
-    _results_sheet().append_row(
-        [
+    """Save result to Google Sheets and return totals with PR info.
+
+    Saves run in worker threads and are serialised so that two concurrent
+    submissions never append duplicate PR rows.
+    """
+
+    with _PERSIST_LOCK:
+        splits_list = list(splits)
+        total = sum(splits_list)
+        validate_splits(total, splits_list)
+        timestamp = datetime.now(timezone.utc).isoformat(sep=" ", timespec="seconds")
+
+        previous_total = _load_best_total(athlete_id, stroke, dist)
+        segment_bests, segment_rows = _load_segment_bests(athlete_id, stroke, dist)
+        total_stats = calc_total_pr(previous_total, total)
+        segment_flags = calc_segment_prs(segment_bests, splits_list)
+        sob_stats: SobStats = calc_sob(segment_bests, splits_list)
+
+        stats_payload: dict[str, Any] = {
+            "new_total_pr": total_stats.is_new,
+            "total_pr_delta": total_stats.delta,
+            "previous_total": total_stats.previous,
+            "segment_prs": segment_flags,
+            "sob_delta": sob_stats.delta,
+            "sob_previous": sob_stats.previous,
+            "sob_current": sob_stats.current,
+        }
+
+        splits_json = json.dumps(splits_list, separators=(",", ":"))
+        result_row = [
             athlete_id,
             athlete_name,
             stroke,
             dist,
             timestamp,
-            json.dumps(splits_list),
+            splits_json,
             total,
             _normalize_comment(comment),
         ]
-    )
-    _log_sheet().append_row([athlete_id, timestamp, "ADD", json.dumps(splits_list)])
-
-    new_prs: list[tuple[int, float]] = []
-    best_buffer = list(segment_bests)
-    if len(best_buffer) < len(splits_list):
-        best_buffer.extend([None] * (len(splits_list) - len(best_buffer)))
-
-    for idx, seg_time in enumerate(splits_list):
-        key = pr_key(athlete_id, stroke, dist, idx)
-        row_idx = segment_rows.get(idx)
-        current_best = best_buffer[idx] if idx < len(best_buffer) else None
-        if row_idx is None:
-            _pr_sheet().append_row([key, seg_time, timestamp])
+        response = _results_sheet().append_row(result_row)
+        _RESULTS_SNAPSHOT.record_append([result_row], response)
+        _LOG_WRITER.submit(_append_log_row, [athlete_id, timestamp, "ADD", splits_json])
+
+        new_prs: list[tuple[int, float]] = []
+        pr_appends: list[list[Any]] = []
+        pr_updates: dict[int, list[Any]] = {}
+        for idx, (seg_time, is_pr) in enumerate(zip(splits_list, segment_flags)):
+            row_idx = segment_rows.get(idx)
+            if row_idx is not None and not is_pr:
+                continue
+            values = [pr_key(athlete_id, stroke, dist, idx), seg_time, timestamp]
+            if row_idx is None:
+                pr_appends.append(values)
+            else:
+                pr_updates[row_idx] = values
             new_prs.append((idx, seg_time))
-            continue
-        if current_best is not None and seg_time >= current_best:
-            continue
-        _pr_sheet().update(f"A{row_idx}:C{row_idx}", [[key, seg_time, timestamp]])
-        new_prs.append((idx, seg_time))
 
-    return total, new_prs, timestamp, stats_payload
+        if pr_updates or pr_appends:
+            pr_sheet = _pr_sheet()
+            if pr_updates:
+                pr_sheet.batch_update(
+                    [
+                        {"range": f"A{row_idx}:C{row_idx}", "values": [values]}
+                        for row_idx, values in pr_updates.items()
+                    ],
+                    value_input_option="RAW",
+                )
+                for row_idx, values in pr_updates.items():
+                    _PR_SNAPSHOT.record_update(row_idx, values)
+            if pr_appends:
+                pr_response = pr_sheet.append_rows(pr_appends)
+                _PR_SNAPSHOT.record_append(pr_appends, pr_response)
+
+        return total, new_prs, timestamp, stats_payload
 
 
 def _analysis_text(
@@ -349,7 +510,7 @@ def _analysis_text(
         else:
             length_arg = [1.0] * len(splits_sec)
         speeds = segment_speeds(splits_sec, length_arg)
-        degradation = calc_degradation(splits_sec, length_arg)
+        degradation = speed_degradation(speeds)
     else:
         speeds = ()
 
@@ -358,7 +519,7 @@ def _analysis_text(
     )
     pace = pace_per_100([total], float(dist))[0] if dist else 0.0
 
-    segments_line = " • ".join(f"{v:.2f} м/с" for v in speeds)
+    segments_line = " • ".join(map(_format_speed, speeds))
 
     return (
         "📊 <b>Аналіз результату</b>\n"
@@ -408,6 +569,32 @@ def _format_result_summary(
     return "\n".join(summary_lines)
 
 
+async def _notify_new_result(
+    notifications: NotificationService,
+    trainers_task: asyncio.Task[Sequence[int]],
+    **details: Any,
+) -> None:
+    """Broadcast a saved result once the athlete's trainers are known."""
+
+    await notifications.notify_new_result(trainers=await trainers_task, **details)
+
+
+async def _reply_and_notify(
+    reply: Awaitable[Any], notification: Awaitable[None]
+) -> None:
+    """Send the result reply and trainer notification concurrently.
+
+    Either side failing is logged without abandoning the other.
+    """
+
+    outcomes = await asyncio.gather(reply, notification, return_exceptions=True)
+    for label, outcome in zip(("reply", "trainer notification"), outcomes):
+        if isinstance(outcome, Exception):
+            logging.error(
+                "Failed to send result %s: %s", label, outcome, exc_info=outcome
+            )
+
+
 async def _finalize_result_entry(
     target: types.Message,
     actor: types.User,
@@ -442,8 +629,10 @@ async def _finalize_result_entry(
 
     await state.clear()
 
+    trainers_task = asyncio.create_task(role_service.trainers_for_athlete(athlete_id))
     try:
-        total, new_prs, timestamp, stats_payload = _persist_result(
+        total, new_prs, timestamp, stats_payload = await asyncio.to_thread(
+            _persist_result,
             athlete_id,
             actor.full_name,
             stroke,
@@ -452,6 +641,7 @@ async def _finalize_result_entry(
             comment=comment_clean,
         )
     except Exception as exc:
+        trainers_task.cancel()
         logging.error("Failed to save result to Google Sheets: %s", exc, exc_info=True)
         await target.answer("Помилка при збереженні результату. Спробуйте пізніше.")
         return
@@ -464,36 +654,40 @@ async def _finalize_result_entry(
         has_comment=bool(comment_clean),
     )
 
-    await target.answer(summary, parse_mode="HTML", reply_markup=keyboard)
-
     analysis_text = _analysis_text(dist, splits, total, segments)
-    await target.answer(analysis_text, parse_mode="HTML")
-
-    trainers = await role_service.trainers_for_athlete(athlete_id)
-    await notifications.notify_new_result(
-        actor_id=actor.id,
-        actor_name=actor.full_name,
-        athlete_id=athlete_id,
-        athlete_name=actor.full_name,
-        dist=dist,
-        stroke=stroke,
-        total=total,
-        timestamp=timestamp,
-        stats=stats_payload,
-        trainers=trainers,
-        new_prs=new_prs,
+    await _reply_and_notify(
+        target.answer(
+            f"{summary}\n\n{analysis_text}", parse_mode="HTML", reply_markup=keyboard
+        ),
+        _notify_new_result(
+            notifications,
+            trainers_task,
+            actor_id=actor.id,
+            actor_name=actor.full_name,
+            athlete_id=athlete_id,
+            athlete_name=actor.full_name,
+            dist=dist,
+            stroke=stroke,
+            total=total,
+            timestamp=timestamp,
+            stats=stats_payload,
+            new_prs=new_prs,
+        ),
     )
 
-    LAST_RESULTS[(actor.id, athlete_id)] = {
-        "athlete_id": athlete_id,
-        "athlete_name": actor.full_name,
-        "stroke": stroke,
-        "dist": dist,
-        "splits": list(splits),
-        "segments": list(float(seg) for seg in (segments or get_segments(dist))),
-        "timestamp": timestamp,
-        "comment": comment_clean,
-    }
+    _remember_last_result(
+        (actor.id, athlete_id),
+        {
+            "athlete_id": athlete_id,
+            "athlete_name": actor.full_name,
+            "stroke": stroke,
+            "dist": dist,
+            "splits": list(splits),
+            "segments": list(float(seg) for seg in (segments or get_segments(dist))),
+            "timestamp": timestamp,
+            "comment": comment_clean,
+        },
+    )
 
 
 @router.callback_query(F.data == "add")
@@ -516,7 +710,7 @@ async def distance_selected(
 
     await cb.answer()
     dist = callback_data.value
-    segments = get_segments(dist)
+    segments = list(get_segments(dist))
     await state.update_data(dist=dist, splits=[], idx=0, segments=segments)
     await cb.message.answer(
         f"Дистанція {dist} м. Оберіть стиль:", reply_markup=get_stroke_keyboard()
@@ -614,7 +808,7 @@ async def dist_chosen(message: types.Message, state: FSMContext) -> None:
         return await message.reply("❗ Дистанція має бути числом у метрах. Приклад: 75")
     if dist <= 0:
         return await message.reply("❗ Дистанція має бути більшою за нуль.")
-    segments = get_segments(dist)
+    segments = list(get_segments(dist))
     await state.update_data(dist=dist, splits=[], idx=0, segments=segments)
     await message.answer(
         f"Дистанція {dist} м. Оберіть стиль:", reply_markup=get_stroke_keyboard()
@@ -629,14 +823,16 @@ async def stroke_chosen(
     """Save stroke and ask for first split."""
 
     await cb.answer()
-    await state.update_data(stroke=callback_data.stroke)
     data = await state.get_data()
-    dist = data["dist"]
-    segments = data.get("segments") or get_segments(dist)
-    segments_list = list(float(seg) for seg in segments)
-    await state.update_data(segments=segments_list)
+    segments = data.get("segments") or get_segments(data["dist"])
+    segments_list = [float(seg) for seg in segments]
+    await advance_state(
+        state,
+        AddResult.collect,
+        stroke=callback_data.stroke,
+        segments=segments_list,
+    )
     await cb.message.answer(_segment_prompt(0, segments_list[0]))
-    await state.set_state(AddResult.collect)
 
 
 @router.message(AddResult.collect)
@@ -645,22 +841,19 @@ async def collect(message: types.Message, state: FSMContext) -> None:
 
     data = await state.get_data()
     dist, idx, splits = data["dist"], data["idx"], data["splits"]
-    raw_segments = data.get("segments") or get_segments(dist)
-    segments = [float(seg) for seg in raw_segments]
-    if data.get("segments") != segments:
-        await state.update_data(segments=segments)
+    # Producers store segments as floats before entering ``collect``
+    segments = data.get("segments") or get_segments(dist)
     raw_value = message.text or ""
     try:
         t = parse_total(raw_value)
     except ValueError:
         return await message.reply(t("error.invalid_time"))
     splits.append(t)
-    await state.update_data(splits=splits)
     if idx + 1 < len(segments):
-        await state.update_data(idx=idx + 1)
+        await state.update_data(splits=splits, idx=idx + 1)
         await message.answer(_segment_prompt(idx + 1, segments[idx + 1]))
         return
-    await state.set_state(AddResult.waiting_for_comment)
+    await advance_state(state, AddResult.waiting_for_comment, splits=splits)
     await message.answer(
         "Хочете додати нотатку до результату? Надішліть текст або натисніть «Пропустити».",
         reply_markup=get_comment_prompt_keyboard(),
@@ -722,8 +915,12 @@ async def repeat_previous(
         return
 
     await cb.answer()
+    trainers_task = asyncio.create_task(
+        role_service.trainers_for_athlete(payload["athlete_id"])
+    )
     try:
-        total, new_prs, timestamp, stats_payload = _persist_result(
+        total, new_prs, timestamp, stats_payload = await asyncio.to_thread(
+            _persist_result,
             payload["athlete_id"],
             payload["athlete_name"],
             payload["stroke"],
@@ -732,6 +929,7 @@ async def repeat_previous(
             comment=None,
         )
     except Exception as exc:
+        trainers_task.cancel()
         logging.error("Failed to repeat result: %s", exc, exc_info=True)
         await cb.message.answer(
             "Не вдалося повторити попередній результат. Спробуйте пізніше."
@@ -739,9 +937,7 @@ async def repeat_previous(
         return
 
     dist = payload["dist"]
-    txt = "🔁 Продубльовано попередній результат!\n" + _format_result_summary(
-        dist, total, new_prs, stats_payload, None
-    )
+    summary = _format_result_summary(dist, total, new_prs, stats_payload, None)
 
     keyboard = get_result_actions_keyboard(
         athlete_id=payload["athlete_id"],
@@ -749,28 +945,31 @@ async def repeat_previous(
         has_comment=False,
     )
 
-    await cb.message.answer(txt, parse_mode="HTML", reply_markup=keyboard)
-
     analysis_text = _analysis_text(
         dist, payload["splits"], total, payload.get("segments")
     )
-    await cb.message.answer(analysis_text, parse_mode="HTML")
+    _retime_last_result(key, payload, timestamp)
 
-    payload.update(timestamp=timestamp, comment="")
-
-    trainers = await role_service.trainers_for_athlete(payload["athlete_id"])
-    await notifications.notify_new_result(
-        actor_id=cb.from_user.id,
-        actor_name=cb.from_user.full_name,
-        athlete_id=payload["athlete_id"],
-        athlete_name=payload["athlete_name"],
-        dist=payload["dist"],
-        stroke=payload["stroke"],
-        total=total,
-        timestamp=timestamp,
-        stats=stats_payload,
-        trainers=trainers,
-        new_prs=new_prs,
+    await _reply_and_notify(
+        cb.message.answer(
+            f"🔁 Продубльовано попередній результат!\n{summary}\n\n{analysis_text}",
+            parse_mode="HTML",
+            reply_markup=keyboard,
+        ),
+        _notify_new_result(
+            notifications,
+            trainers_task,
+            actor_id=cb.from_user.id,
+            actor_name=cb.from_user.full_name,
+            athlete_id=payload["athlete_id"],
+            athlete_name=payload["athlete_name"],
+            dist=payload["dist"],
+            stroke=payload["stroke"],
+            total=total,
+            timestamp=timestamp,
+            stats=stats_payload,
+            new_prs=new_prs,
+        ),
     )
 
 
@@ -784,15 +983,13 @@ async def comment_edit(
     athlete_id = callback_data.athlete_id
 
     try:
-        row_idx = _find_result_row(athlete_id, timestamp)
+        row_idx = await asyncio.to_thread(_find_result_row, athlete_id, timestamp)
     except ValueError:
         await cb.answer("Результат не знайдено", show_alert=True)
         return
 
     try:
-        current_comment = (
-            _results_sheet().cell(row_idx, COMMENT_COLUMN_INDEX).value or ""
-        )
+        current_comment = await asyncio.to_thread(_read_comment, row_idx)
     except Exception as exc:
         logging.error("Failed to load comment: %s", exc, exc_info=True)
         await cb.answer("Не вдалося завантажити нотатку", show_alert=True)
@@ -832,7 +1029,7 @@ async def save_comment_edit(message: types.Message, state: FSMContext) -> None:
         return
 
     try:
-        _update_comment(athlete_id, timestamp, message.text)
+        await asyncio.to_thread(_update_comment, athlete_id, timestamp, message.text)
     except ValueError:
         await state.clear()
         await message.answer("Результат не знайдено. Спробуйте оновити історію.")
@@ -859,7 +1056,7 @@ async def clear_comment(
     athlete_id = callback_data.athlete_id
 
     try:
-        _update_comment(athlete_id, timestamp, None)
+        await asyncio.to_thread(_update_comment, athlete_id, timestamp, None)
     except ValueError:
         await cb.answer("Результат не знайдено", show_alert=True)
         return
@@ -888,7 +1085,7 @@ async def cmd_results(message: types.Message) -> None:
     """Show latest results together with comments."""
 
     try:
-        rows = _results_sheet().get_all_values()
+        rows = await asyncio.to_thread(_RESULTS_SNAPSHOT.rows)
     except Exception as exc:
         logging.error("Failed to load results: %s", exc, exc_info=True)
         await message.answer("Не вдалося завантажити результати. Спробуйте пізніше.")
@@ -899,18 +1096,22 @@ async def cmd_results(message: types.Message) -> None:
         return
 
     user_id = str(message.from_user.id)
-    user_rows = [row for row in rows[1:] if row and str(row[0]) == user_id]
-    if not user_rows:
+    latest: list[list[str]] = []
+    for row in islice(reversed(rows), len(rows) - 1):
+        if row and str(row[0]) == user_id:
+            latest.append(row)
+            if len(latest) == 5:
+                break
+    if not latest:
         await message.answer("Для вас ще немає зафіксованих результатів.")
         return
 
-    latest = list(reversed(user_rows[-5:]))
     blocks: list[str] = []
     for row in latest:
         try:
             dist = int(row[3])
             timestamp = row[4]
-            total = float(str(row[6]).replace(",", "."))
+            total = sheet_float(row[6])
             splits = json.loads(row[5]) if row[5] else []
         except (ValueError, json.JSONDecodeError, IndexError) as exc:
             logging.warning("Skipping malformed result row: %s (%s)", row, exc)
@@ -932,91 +1133,87 @@ async def cmd_results(message: types.Message) -> None:
     )
 
 
-@router.callback_query(F.data == "history")
+def _format_history_entry(row: list[str]) -> str:
+    """Render one results row for :func:`history`.
+
+    Raises ``ValueError``, ``IndexError`` or ``json.JSONDecodeError`` for
+    malformed rows so the caller can skip them as a whole.
+    """
+
+    dist = int(row[3])
+    segs = get_segments(dist)
+    splits = [float(value) for value in json.loads(row[5])]
+    speeds = segment_speeds(splits[: len(segs)], segs[: len(splits)])
+    lines = [f"<b>{row[4]} | {dist} м:</b>"]
+    for i, split_sec in enumerate(splits):
+        split_fmt = fmt_time(split_sec)
+        if i >= len(speeds):
+            lines.append(f"  - Відрізок {i+1}: {split_fmt} (ПОМИЛКА: зайвий відрізок)")
+            continue
+        lines.append(
+            f"  - Відрізок {i+1}: {split_fmt} (швидкість: {speeds[i]:.2f} м/с)"
+        )
+    if len(row) > 7 and row[7].strip():
+        lines.append(f"  📝 Нотатка: {_comment_to_html(row[7].strip())}")
+    return "\n".join(lines)
+
+
+@router.callback_query(F.data.in_({"history", CB_MENU_HISTORY}))
 async def history(cb: types.CallbackQuery) -> None:
     """Show history of results for user."""
 
+    await cb.answer()
     try:
-        rows = _results_sheet().get_all_values()[::-1]
-        out = []
-        processed_count = 0
-        for row in rows:
-            if row and str(row[0]) == str(cb.from_user.id):
-                try:
-                    dist = int(row[3])
-                    splits = json.loads(row[5])
-                    date = row[4]
-
-                    out.append(f"<b>{date} | {dist} м:</b>")
-
-                    for i, t in enumerate(splits):
-                        try:
-                            segment_speed = segment_speeds(
-                                [float(t)], get_segments(dist)[i]
-                            )[0]
-                            out.append(
-                                f"  - Відрізок {i+1}: {fmt_time(float(t))} (швидкість: {segment_speed:.2f} м/с)"
-                            )
-                        except IndexError:
-                            out.append(
-                                f"  - Відрізок {i+1}: {fmt_time(float(t))} (ПОМИЛКА: зайвий відрізок)"
-                            )
-
-                    if len(row) > 7 and row[7].strip():
-                        out.append(f"  📝 Нотатка: {_comment_to_html(row[7].strip())}")
-
-                    out.append("-" * 20)
-                    processed_count += 1
-
-                except (ValueError, json.JSONDecodeError, IndexError) as e:
-                    logging.warning(
-                        "Skipping malformed row for user %s: %s. Error: %s",
-                        cb.from_user.id,
-                        row,
-                        e,
-                    )
-                    continue
-
-                if processed_count >= 10:
-                    out.append("...")
-                    break
+        owned = await asyncio.to_thread(_RESULTS_BY_OWNER.get, cb.from_user.id)
+        entries: list[str] = []
+        for row_idx in sorted(owned, reverse=True):
+            row = owned[row_idx]
+            try:
+                entries.append(f"{_format_history_entry(row)}\n{HISTORY_SEPARATOR}")
+            except (ValueError, json.JSONDecodeError, IndexError) as e:
+                logging.warning(
+                    "Skipping malformed row for user %s: %s. Error: %s",
+                    cb.from_user.id,
+                    row,
+                    e,
+                )
+                continue
+            if len(entries) >= HISTORY_LIMIT:
+                entries.append("...")
+                break
 
-        await cb.message.answer(
-            "\n".join(out) if out else "Історія поки порожня.",
-            parse_mode="HTML",
-        )
+        if not entries:
+            await cb.message.answer("Історія поки порожня.", parse_mode="HTML")
+            return
+        for chunk in _message_chunks(entries, sep="\n"):
+            await cb.message.answer(chunk, parse_mode="HTML")
 
     except Exception as e:
         logging.error(f"Critical error in history handler: {e}", exc_info=True)
         await cb.message.answer("Сталася критична помилка при завантаженні історії.")
 
 
-@router.callback_query(F.data == "records")
+@router.callback_query(F.data.in_({"records", CB_MENU_RECORDS}))
 async def records(cb: types.CallbackQuery) -> None:
     """Display personal records."""
 
-    rows = _pr_sheet().get_all_values()
-    best = {}
-    for row in rows:
-        try:
-            uid, _, dist, _ = row[0].split("|")
-            if int(uid) == cb.from_user.id:
-                dist_key = int(dist)
-                best.setdefault(dist_key, []).append(float(row[1].replace(",", ".")))
-        except (ValueError, IndexError):
-            continue
+    await cb.answer()
+    owned = await asyncio.to_thread(_PRS_BY_OWNER.get, cb.from_user.id)
+    best: defaultdict[int, list[float]] = defaultdict(list)
+    for row_idx in sorted(owned):
+        dist, value = owned[row_idx]
+        best[dist].append(value)
 
     if not best:
-        return await cb.answer("Немає рекордів.")
+        return await cb.message.answer("Немає рекордів.")
 
-    lines = []
-    for dist, arr in sorted(best.items()):
-        total = sum(arr)
-        lines.append(
-            f"🏅 {dist} м → {fmt_time(total)} (сума найкращих)\n"
-            + " • ".join(fmt_time(t) for t in arr)
-        )
-    await cb.message.answer("\n\n".join(lines))
+    blocks = (
+        f"🏅 {dist} м → {fmt_time(sum(arr))} (сума найкращих)\n"
+        + " • ".join(map(fmt_time, arr))
+        for dist, arr in sorted(best.items())
+    )
+    for chunk in _message_chunks(blocks):
+        await cb.message.answer(chunk)
 
 
 @router.callback_query(F.data == CB_MENU_ADD_RESULT)
@@ -1025,71 +1222,66 @@ async def menu_sprint(
 ) -> None:
     """Show list of athletes for result entry."""
 
+    await cb.answer()
     try:
-        records = _athletes_sheet().get_all_records()
+        parsed_records = await get_athletes()
     except Exception as e:
         logging.error(f"Failed to get athletes list: {e}")
         return await cb.message.answer(
             "Помилка: не вдалося отримати список спортсменів. Спробуйте пізніше."
         )
 
-    parsed_records: list[tuple[int, str]] = []
-    for rec in records:
-        try:
-            athlete_id = int(rec["ID"])
-        except (KeyError, TypeError, ValueError):
-            continue
-        name = rec.get("Name", str(athlete_id))
-        parsed_records.append((athlete_id, name))
-
+    lookup = role_service.get_role_and_accessible(cb.from_user.id)
     if parsed_records:
-        await role_service.bulk_sync_athletes(parsed_records)
-
-    role = await role_service.get_role(cb.from_user.id)
+        _, (role, accessible) = await asyncio.gather(
+            role_service.bulk_sync_athletes(parsed_records), lookup
+        )
+    else:
+        role, accessible = await lookup
     if role == ROLE_ATHLETE:
-        await state.update_data(athlete_id=cb.from_user.id)
+        await advance_state(state, AddResult.choose_dist, athlete_id=cb.from_user.id)
         await cb.message.answer(
             "Оберіть дистанцію або введіть вручну:",
             reply_markup=get_distance_keyboard(),
         )
-        await state.set_state(AddResult.choose_dist)
-        await cb.answer()
         return
 
-    accessible_ids = set(await role_service.get_accessible_athletes(cb.from_user.id))
+    accessible_ids = set(accessible)
     restrict_to_assigned = role == ROLE_TRAINER
-    buttons = []
-    for athlete_id, athlete_name in parsed_records:
-        if restrict_to_assigned and athlete_id not in accessible_ids:
-            continue
-        buttons.append(
-            InlineKeyboardButton(
-                text=athlete_name, callback_data=f"select_{athlete_id}"
-            )
-        )
+    visible = tuple(
+        (athlete_id, athlete_name)
+        for athlete_id, athlete_name in parsed_records
+        if not restrict_to_assigned or athlete_id in accessible_ids
+    )
 
-    if not buttons:
+    if not visible:
         await cb.message.answer("Немає спортсменів, до яких у вас є доступ.")
-        await cb.answer()
         return
 
-    kb = InlineKeyboardMarkup(inline_keyboard=[buttons])
+    kb = get_athlete_select_keyboard(visible)
+    await state.update_data(
+        selectable_athletes=[athlete_id for athlete_id, _ in visible]
+    )
     await cb.message.answer("Оберіть спортсмена:", reply_markup=kb)
     await state.set_state(AddResult.choose_athlete)
-    await cb.answer()
 
 
-@router.callback_query(F.data.startswith("select_"))
+@router.callback_query(AthleteSelectCB.filter())
 async def select_athlete(
-    cb: types.CallbackQuery, state: FSMContext, role_service: RoleService
+    cb: types.CallbackQuery,
+    callback_data: AthleteSelectCB,
+    state: FSMContext,
+    role_service: RoleService,
 ) -> None:
     """Save selected athlete and ask for distance."""
 
-    try:
-        athlete_id = int(cb.data.split("_", 1)[1])
-    except ValueError:
-        return await cb.message.answer("Помилка: ID спортсмена має бути числом.")
-    if not await role_service.can_access_athlete(cb.from_user.id, athlete_id):
+    athlete_id = callback_data.athlete_id
+    selectable = (await state.get_data()).get("selectable_athletes")
+    if selectable is not None:
+        allowed = athlete_id in selectable
+    else:
+        allowed = await role_service.can_access_athlete(cb.from_user.id, athlete_id)
+    if not allowed:
         await cb.answer("Немає доступу до цього спортсмена.", show_alert=True)
         return
     await state.update_data(athlete_id=athlete_id)
@@ -1100,22 +1292,9 @@ async def select_athlete(
     await state.set_state(AddResult.choose_dist)
 
 
-@router.callback_query(F.data == CB_MENU_HISTORY)
-async def menu_history(cb: types.CallbackQuery) -> None:
-    """Menu alias for history."""
-
-    await history(cb)
-
-
-@router.callback_query(F.data == CB_MENU_RECORDS)
-async def menu_records(cb: types.CallbackQuery) -> None:
-    """Menu alias for records."""
-
-    await records(cb)
-
-
 @router.callback_query(F.data == CB_MENU_STAYER)
 async def menu_stayer(cb: types.CallbackQuery) -> None:
     """Notify that stayer block is under construction."""
 
+    await cb.answer()
     await cb.message.answer("🚧 Блок «Стаєр» ще в розробці – скоро буде!")
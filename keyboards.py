@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import binascii
+from functools import lru_cache
 from typing import TYPE_CHECKING, Iterable, Sequence
 
 from aiogram.filters.callback_data import CallbackData
@@ -12,7 +13,7 @@ from aiogram.types import (
     ReplyKeyboardMarkup,
 )
 
-from i18n import t
+from i18n import get_current_language, t
 from menu_callbacks import (
     CB_MENU_ADD_RESULT,
     CB_MENU_ADMIN,
@@ -81,6 +82,12 @@ class TemplateCB(CallbackData, prefix="tpl"):
     template_id: str
 
 
+class AthleteSelectCB(CallbackData, prefix="select"):
+    """Callback factory for picking an athlete in the result wizard."""
+
+    athlete_id: int
+
+
 class RepeatCB(CallbackData, prefix="repeat"):
     """Callback factory for repeating the previous result."""
 
@@ -229,13 +236,33 @@ def get_sportsmen_keyboard(sportsmen: list) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=[buttons])
 
 
+@lru_cache(maxsize=64)
+def get_athlete_select_keyboard(
+    athletes: tuple[tuple[int, str], ...],
+) -> InlineKeyboardMarkup:
+    """Return two-column athlete picker, cached per visible athlete set."""
+
+    buttons = [
+        InlineKeyboardButton(
+            text=name, callback_data=AthleteSelectCB(athlete_id=athlete_id).pack()
+        )
+        for athlete_id, name in athletes
+    ]
+    return InlineKeyboardMarkup(inline_keyboard=_chunk_buttons(buttons))
+
+
 def get_distance_keyboard() -> InlineKeyboardMarkup:
     """Return keyboard with frequently used sprint distances."""
 
+    return _distance_keyboard(get_current_language())
+
+
+@lru_cache(maxsize=8)
+def _distance_keyboard(lang: str) -> InlineKeyboardMarkup:
     distance_buttons = [
         [
             InlineKeyboardButton(
-                text=t(KB_DISTANCE_VALUE, distance=dist),
+                text=t(KB_DISTANCE_VALUE, lang=lang, distance=dist),
                 callback_data=DistanceCB(value=dist).pack(),
             )
             for dist in row
@@ -245,10 +272,10 @@ def get_distance_keyboard() -> InlineKeyboardMarkup:
 
     extra_row = [
         InlineKeyboardButton(
-            text=t(KB_DISTANCE_TEMPLATES), callback_data="choose_template"
+            text=t(KB_DISTANCE_TEMPLATES, lang=lang), callback_data="choose_template"
         ),
         InlineKeyboardButton(
-            text=t(KB_DISTANCE_OTHER), callback_data="manual_distance"
+            text=t(KB_DISTANCE_OTHER, lang=lang), callback_data="manual_distance"
         ),
     ]
 
@@ -256,8 +283,15 @@ def get_distance_keyboard() -> InlineKeyboardMarkup:
 
 
 def get_template_keyboard(templates: Iterable[tuple[str, str]]) -> InlineKeyboardMarkup:
-    """Build keyboard with template choices."""
+    """Build keyboard with template choices, cached per template set and language."""
 
+    return _template_keyboard(tuple(templates), get_current_language())
+
+
+@lru_cache(maxsize=32)
+def _template_keyboard(
+    templates: tuple[tuple[str, str], ...], lang: str
+) -> InlineKeyboardMarkup:
     buttons: list[list[InlineKeyboardButton]] = []
     row: list[InlineKeyboardButton] = []
 
@@ -276,7 +310,9 @@ def get_template_keyboard(templates: Iterable[tuple[str, str]]) -> InlineKeyboar
 
     buttons.append(
         [
-            InlineKeyboardButton(text=t(COMMON_BACK), callback_data="back_to_distance"),
+            InlineKeyboardButton(
+                text=t(COMMON_BACK, lang=lang), callback_data="back_to_distance"
+            ),
         ]
     )
 
@@ -381,8 +417,13 @@ def get_onboarding_skip_keyboard(action: str = "group") -> InlineKeyboardMarkup:
     )
 
 
+@lru_cache(maxsize=1024)
 def pack_timestamp_for_callback(timestamp: str) -> str:
-    """Convert timestamp to callback-friendly format."""
+    """Convert timestamp to callback-friendly format.
+
+    Results are cached because the same timestamp is packed for every
+    keyboard attached to a saved result.
+    """
 
     encoded = base64.urlsafe_b64encode(timestamp.encode("utf-8")).decode("ascii")
     return encoded.rstrip("=")
@@ -920,6 +961,52 @@ def build_search_pr_keyboard() -> InlineKeyboardMarkup:
     )
 
 
+def build_search_items_rows(
+    results: Sequence["SearchResult"], start_index: int
+) -> list[list[InlineKeyboardButton]]:
+    """Return one report button row per search result."""
+
+    return [
+        [
+            InlineKeyboardButton(
+                text=t("search.report_btn", idx=idx),
+                switch_inline_query_current_chat=f"/report {item.result_id}",
+            )
+        ]
+        for idx, item in enumerate(results, start=start_index + 1)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _search_nav_row(
+    page: int, total_pages: int, lang: str
+) -> tuple[InlineKeyboardButton, ...]:
+    nav_row: list[InlineKeyboardButton] = []
+    if page > 1:
+        nav_row.append(
+            InlineKeyboardButton(
+                text=t("search.prev", lang=lang),
+                callback_data=SearchPageCB(page=page - 1).pack(),
+            )
+        )
+    if page < total_pages:
+        nav_row.append(
+            InlineKeyboardButton(
+                text=t("search.next", lang=lang),
+                callback_data=SearchPageCB(page=page + 1).pack(),
+            )
+        )
+    return tuple(nav_row)
+
+
+def build_search_nav_row(page: int, total_pages: int) -> list[InlineKeyboardButton]:
+    """Return pagination buttons, reusing cached rows per page and language."""
+
+    if total_pages <= 1:
+        return []
+    return list(_search_nav_row(page, total_pages, get_current_language()))
+
+
 def build_search_results_keyboard(
     results: Sequence["SearchResult"],
     *,
@@ -929,34 +1016,9 @@ def build_search_results_keyboard(
 ) -> InlineKeyboardMarkup:
     """Return keyboard with report buttons and pagination controls."""
 
-    buttons: list[list[InlineKeyboardButton]] = []
-    for idx, item in enumerate(results, start=start_index + 1):
-        buttons.append(
-            [
-                InlineKeyboardButton(
-                    text=t("search.report_btn", idx=idx),
-                    switch_inline_query_current_chat=f"/report {item.result_id}",
-                )
-            ]
-        )
-
-    if total_pages > 1:
-        nav_row: list[InlineKeyboardButton] = []
-        if page > 1:
-            nav_row.append(
-                InlineKeyboardButton(
-                    text=t("search.prev"),
-                    callback_data=SearchPageCB(page=page - 1).pack(),
-                )
-            )
-        if page < total_pages:
-            nav_row.append(
-                InlineKeyboardButton(
-                    text=t("search.next"),
-                    callback_data=SearchPageCB(page=page + 1).pack(),
-                )
-            )
-        if nav_row:
-            buttons.append(nav_row)
+    buttons = build_search_items_rows(results, start_index)
+    nav_row = build_search_nav_row(page, total_pages)
+    if nav_row:
+        buttons.append(nav_row)
 
     return InlineKeyboardMarkup(inline_keyboard=buttons)
@@ -6,6 +6,7 @@ import asyncio
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
+from time import monotonic
 from typing import Iterable, Sequence
 
 from aiogram.types import Contact, User
@@ -14,6 +15,8 @@ ROLE_ATHLETE = "athlete"
 ROLE_TRAINER = "trainer"
 ROLE_ADMIN = "admin"
 VALID_ROLES = (ROLE_ATHLETE, ROLE_TRAINER, ROLE_ADMIN)
+ACCESS_CACHE_TTL = 60.0
+ACCESS_CACHE_LIMIT = 10_000
 
 
 @dataclass(frozen=True)
@@ -39,12 +42,15 @@ class RoleService:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = asyncio.Lock()
+        self._synced_athletes: tuple[tuple[int, str], ...] | None = None
+        self._access_cache: dict[tuple[int, int], tuple[float, bool]] = {}
 
     async def init(self, *, admin_ids: Iterable[int] = ()) -> None:
         """Ensure schema exists and preload default admins."""
 
         async with self._lock:
             await asyncio.to_thread(self._setup, tuple(admin_ids))
+        self._access_cache.clear()
 
     async def upsert_user(
         self, user: User | Contact | None, *, default_role: str = ROLE_ATHLETE
@@ -65,14 +71,22 @@ class RoleService:
         await asyncio.to_thread(
             self._upsert_user, int(user_id), full_name or "", default_role
         )
+        self._synced_athletes = None
 
     async def bulk_sync_athletes(
         self,
         records: Iterable[tuple[int, str]],
     ) -> None:
-        """Synchronise athlete records from Google Sheets."""
+        """Synchronise athlete records from Google Sheets.
 
-        await asyncio.to_thread(self._bulk_sync_athletes, tuple(records))
+        Repeated calls with the same records are skipped.
+        """
+
+        snapshot = tuple(records)
+        if snapshot == self._synced_athletes:
+            return
+        await asyncio.to_thread(self._bulk_sync_athletes, snapshot)
+        self._synced_athletes = snapshot
 
     async def set_role(self, user_id: int, role: str) -> None:
         """Assign role to user creating the record if required."""
@@ -80,6 +94,7 @@ class RoleService:
         if role not in VALID_ROLES:
             raise ValueError(f"Unsupported role: {role}")
         await asyncio.to_thread(self._set_role, user_id, role)
+        self._access_cache.clear()
 
     async def get_role(self, user_id: int) -> str:
         """Return stored role or default athlete if user is unknown."""
@@ -99,6 +114,7 @@ class RoleService:
         """Assign primary trainer for athlete (overrides previous)."""
 
         await asyncio.to_thread(self._set_trainer, athlete_id, trainer_id)
+        self._access_cache.clear()
 
     async def trainers_for_athlete(self, athlete_id: int) -> Sequence[int]:
         """Return trainer ids linked to athlete."""
@@ -116,23 +132,41 @@ class RoleService:
     ) -> Sequence[int]:
         """Return athlete ids the requester is allowed to manage."""
 
-        role = await self.get_role(requester_id)
-        if role == ROLE_ADMIN:
-            athletes = await self.list_users(roles=(ROLE_ATHLETE,))
-            return tuple(user.telegram_id for user in athletes)
-        if role == ROLE_TRAINER:
-            return tuple(await self.athletes_for_trainer(requester_id))
-        return (requester_id,)
+        _, athletes = await self.get_role_and_accessible(requester_id)
+        return athletes
+
+    async def get_role_and_accessible(
+        self,
+        requester_id: int,
+    ) -> tuple[str, tuple[int, ...]]:
+        """Return requester role and manageable athlete ids in one lookup."""
+
+        return await asyncio.to_thread(self._role_and_accessible, requester_id)
 
     async def can_access_athlete(
         self,
         requester_id: int,
         athlete_id: int,
     ) -> bool:
-        """Check if requester has permission to view athlete data."""
+        """Check if requester has permission to view athlete data.
+
+        Answers are cached for ``ACCESS_CACHE_TTL`` seconds and dropped
+        whenever roles or trainer assignments change.
+        """
 
         if requester_id == athlete_id:
             return True
+        key = (requester_id, athlete_id)
+        cached = self._access_cache.get(key)
+        if cached is not None and monotonic() < cached[0]:
+            return cached[1]
+        allowed = await self._check_access(requester_id, athlete_id)
+        if len(self._access_cache) >= ACCESS_CACHE_LIMIT:
+            self._access_cache.clear()
+        self._access_cache[key] = (monotonic() + ACCESS_CACHE_TTL, allowed)
+        return allowed
+
+    async def _check_access(self, requester_id: int, athlete_id: int) -> bool:
         role = await self.get_role(requester_id)
         if role == ROLE_ADMIN:
             return True
@@ -206,17 +240,16 @@ class RoleService:
         if not records:
             return
         with self._connect() as conn:
-            for athlete_id, name in records:
-                conn.execute(
-                    """
-                    INSERT INTO users (telegram_id, full_name, role)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(telegram_id) DO UPDATE
-                        SET full_name = excluded.full_name,
-                        updated_at = CURRENT_TIMESTAMP
-                    """,
-                    (athlete_id, name, ROLE_ATHLETE),
-                )
+            conn.executemany(
+                """
+                INSERT INTO users (telegram_id, full_name, role)
+                VALUES (?, ?, ?)
+                ON CONFLICT(telegram_id) DO UPDATE
+                    SET full_name = excluded.full_name,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [(athlete_id, name, ROLE_ATHLETE) for athlete_id, name in records],
+            )
             conn.commit()
 
     def _set_role(self, user_id: int, role: str) -> None:
@@ -241,6 +274,29 @@ class RoleService:
             row = cur.fetchone()
             return row["role"] if row else ROLE_ATHLETE
 
+    def _role_and_accessible(self, user_id: int) -> tuple[str, tuple[int, ...]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT role FROM users WHERE telegram_id = ?", (user_id,)
+            ).fetchone()
+            role = row["role"] if row else ROLE_ATHLETE
+            if role == ROLE_ADMIN:
+                rows = conn.execute(
+                    """
+                    SELECT telegram_id FROM users WHERE role = ?
+                    ORDER BY full_name, telegram_id
+                    """,
+                    (ROLE_ATHLETE,),
+                ).fetchall()
+                return role, tuple(row["telegram_id"] for row in rows)
+            if role == ROLE_TRAINER:
+                rows = conn.execute(
+                    "SELECT athlete_id FROM trainer_athletes WHERE trainer_id = ?",
+                    (user_id,),
+                ).fetchall()
+                return role, tuple(row["athlete_id"] for row in rows)
+            return role, (user_id,)
+
     def _list_users(self, roles: Sequence[str] | None) -> Sequence[RoleUser]:
         query = "SELECT telegram_id, full_name, role FROM users"
         params: tuple[object, ...] = ()
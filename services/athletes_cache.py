@@ -0,0 +1,55 @@
+"""Short-lived in-process cache of registered athletes."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Any, Iterable, Sequence
+
+DEFAULT_TTL = 60.0
+
+_lock = asyncio.Lock()
+_cache: tuple[float, tuple[tuple[int, str], ...]] | None = None
+
+
+def parse_athlete_records(
+    rows: Iterable[Sequence[Any]],
+) -> list[tuple[int, str]]:
+    """Convert raw ``ID, Name`` rows into ``(athlete_id, name)`` pairs."""
+
+    parsed: list[tuple[int, str]] = []
+    for row in rows:
+        raw_id = str(row[0]).strip() if row else ""
+        if not raw_id.isdecimal():
+            continue
+        athlete_id = int(raw_id)
+        parsed.append((athlete_id, row[1] if len(row) > 1 else str(athlete_id)))
+    return parsed
+
+
+def _fetch_athletes() -> list[tuple[int, str]]:
+    from services import get_athletes_worksheet
+
+    return parse_athlete_records(get_athletes_worksheet().get("A2:B"))
+
+
+async def get_athletes(ttl: float = DEFAULT_TTL) -> list[tuple[int, str]]:
+    """Return registered athletes, downloading them at most once per ``ttl``."""
+
+    global _cache
+
+    async with _lock:
+        if _cache is None or monotonic() >= _cache[0]:
+            athletes = await asyncio.to_thread(_fetch_athletes)
+            _cache = (monotonic() + ttl, tuple(athletes))
+        return list(_cache[1])
+
+
+def invalidate() -> None:
+    """Drop cached athletes so the next lookup reloads the worksheet."""
+
+    global _cache
+    _cache = None
+
+
+__all__ = ["DEFAULT_TTL", "get_athletes", "invalidate", "parse_athlete_records"]
@@ -0,0 +1,200 @@
+"""In-process snapshots of Google Sheets worksheets."""
+
+from __future__ import annotations
+
+import re
+import threading
+from time import monotonic
+from typing import Any, Callable, Generic, Hashable, Iterable, Sequence, TypeVar
+
+DEFAULT_TTL = 60.0
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_UPDATED_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+
+
+def appended_row(response: Any) -> int | None:
+    """Extract the first written row number from a values ``append`` response."""
+
+    if not isinstance(response, dict):
+        return None
+    updated_range = response.get("updates", {}).get("updatedRange", "")
+    match = _UPDATED_ROW_RE.search(str(updated_range))
+    return int(match.group(1)) if match else None
+
+
+def _cell(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+class SheetSnapshot:
+    """Worksheet rows cached in memory and refreshed after ``ttl`` seconds.
+
+    Writers mirror successful appends and updates into the snapshot so that
+    subsequent reads see their own changes without another download. Any
+    mismatch between the mirrored state and the API response marks the
+    snapshot dirty and forces a reload on the next read.
+    """
+
+    def __init__(
+        self,
+        worksheet_getter: Callable[[], Any],
+        *,
+        ttl: float = DEFAULT_TTL,
+    ) -> None:
+        self._getter = worksheet_getter
+        self.ttl = ttl
+        self._rows: list[list[str]] | None = None
+        self._loaded_at = 0.0
+        self._dirty = True
+        self._generation = 0
+        self._indexes: list[SheetIndex[Any, Any]] = []
+        self._lock = threading.RLock()
+
+    def _fresh_rows(self) -> list[list[str]] | None:
+        """Return cached rows if they are still valid, otherwise ``None``."""
+
+        if self._dirty or monotonic() - self._loaded_at > self.ttl:
+            return None
+        return self._rows
+
+    def rows(self) -> list[list[str]]:
+        """Return cached worksheet values, downloading them when stale."""
+
+        with self._lock:
+            rows = self._fresh_rows()
+            if rows is None:
+                rows = [list(row) for row in self._getter().get_all_values()]
+                self._rows = rows
+                self._loaded_at = monotonic()
+                self._dirty = False
+                self._generation += 1
+            return rows
+
+    def index(
+        self, parse: Callable[[list[str]], tuple[K, V] | None]
+    ) -> SheetIndex[K, V]:
+        """Return a keyed index over this snapshot built with ``parse``."""
+
+        index: SheetIndex[K, V] = SheetIndex(self, parse)
+        with self._lock:
+            self._indexes.append(index)
+        return index
+
+    def _reindex(self, row_idx: int, row: list[str]) -> None:
+        for index in self._indexes:
+            index._apply(row_idx, row)
+
+    def record_append(
+        self, rows: Iterable[Sequence[Any]], response: Any = None
+    ) -> None:
+        """Mirror rows appended to the worksheet."""
+
+        with self._lock:
+            cached = self._fresh_rows()
+            if cached is None:
+                return
+            first_row = appended_row(response)
+            if first_row is not None and first_row != len(cached) + 1:
+                self._dirty = True
+                return
+            for row in rows:
+                cached.append([_cell(value) for value in row])
+                self._reindex(len(cached), cached[-1])
+
+    def record_update(self, row_idx: int, values: Sequence[Any]) -> None:
+        """Mirror a full-row update starting at column ``A``."""
+
+        with self._lock:
+            cached = self._fresh_rows()
+            if cached is None:
+                return
+            if not 1 <= row_idx <= len(cached):
+                self._dirty = True
+                return
+            row = cached[row_idx - 1]
+            cells = [_cell(value) for value in values]
+            row[: len(cells)] = cells
+            self._reindex(row_idx, row)
+
+    def record_cell(self, row_idx: int, col_idx: int, value: Any) -> None:
+        """Mirror a single cell update."""
+
+        with self._lock:
+            cached = self._fresh_rows()
+            if cached is None:
+                return
+            if not 1 <= row_idx <= len(cached):
+                self._dirty = True
+                return
+            row = cached[row_idx - 1]
+            if len(row) < col_idx:
+                row.extend([""] * (col_idx - len(row)))
+            row[col_idx - 1] = _cell(value)
+            self._reindex(row_idx, row)
+
+    def invalidate(self) -> None:
+        """Force the next read to download fresh values."""
+
+        with self._lock:
+            self._dirty = True
+
+
+class SheetIndex(Generic[K, V]):
+    """Snapshot rows grouped by key and parsed once per download.
+
+    ``parse`` turns a raw row into ``(key, value)`` or ``None`` to skip it.
+    Rows mirrored into the snapshot are re-parsed individually, so lookups
+    only touch the rows belonging to the requested key.
+    """
+
+    def __init__(
+        self,
+        snapshot: SheetSnapshot,
+        parse: Callable[[list[str]], tuple[K, V] | None],
+    ) -> None:
+        self._snapshot = snapshot
+        self._parse = parse
+        self._groups: dict[K, dict[int, V]] = {}
+        self._row_keys: dict[int, K] = {}
+        self._generation = -1
+
+    def get(self, key: K) -> dict[int, V]:
+        """Return ``{row_number: value}`` for rows stored under ``key``."""
+
+        with self._snapshot._lock:
+            rows = self._snapshot.rows()
+            if self._generation != self._snapshot._generation:
+                self._groups = {}
+                self._row_keys = {}
+                for row_idx, row in enumerate(rows, start=1):
+                    self._add(row_idx, row)
+                self._generation = self._snapshot._generation
+            return dict(self._groups.get(key, {}))
+
+    def _add(self, row_idx: int, row: list[str]) -> None:
+        try:
+            parsed = self._parse(row)
+        except (ValueError, IndexError, TypeError, AttributeError):
+            parsed = None
+        if parsed is None:
+            return
+        key, value = parsed
+        self._groups.setdefault(key, {})[row_idx] = value
+        self._row_keys[row_idx] = key
+
+    def _apply(self, row_idx: int, row: list[str]) -> None:
+        if self._generation != self._snapshot._generation:
+            return
+        old_key = self._row_keys.pop(row_idx, None)
+        if old_key is not None:
+            group = self._groups.get(old_key, {})
+            group.pop(row_idx, None)
+            if not group:
+                self._groups.pop(old_key, None)
+        self._add(row_idx, row)
+
+
+__all__ = ["DEFAULT_TTL", "SheetIndex", "SheetSnapshot", "appended_row"]
@@ -227,7 +227,18 @@ def degradation_percent(
     0.0
     """
 
-    speeds = segment_speeds(splits, segment_length)
+    return speed_degradation(segment_speeds(splits, segment_length))
+
+
+def speed_degradation(speeds: Sequence[float]) -> float:
+    """Return degradation percentage for already computed segment speeds.
+
+    >>> round(speed_degradation([2.0, 1.5]), 2)
+    25.0
+    >>> speed_degradation([0.0, 1.0])
+    0.0
+    """
+
     if len(speeds) < 2:
         return 0.0
     first = speeds[0]
@@ -334,6 +345,7 @@ __all__ = [
     "avg_speed",
     "pace_per_100",
     "degradation_percent",
+    "speed_degradation",
     "detect_total_pr",
     "detect_segment_prs",
     "calc_sob",
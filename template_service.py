@@ -113,6 +113,10 @@ class TemplateService:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = asyncio.Lock()
         self._audit = audit_service
+        # Sorted templates keyed by the storage file's (mtime_ns, size)
+        self._cache: tuple[SprintTemplate, ...] | None = None
+        self._cache_stamp: tuple[int, int] | None = None
+        self._by_id: dict[str, SprintTemplate] = {}
 
     async def init(self) -> None:
         """Ensure storage file exists and contains valid JSON."""
@@ -134,17 +138,21 @@ class TemplateService:
         """Return all available templates sorted by title."""
 
         async with self._lock:
-            templates = await asyncio.to_thread(self._read_all)
-        return tuple(sorted(templates, key=lambda tpl: tpl.title.lower()))
+            stamp = self._stamp()
+            if self._cache is None or stamp is None or stamp != self._cache_stamp:
+                templates = await asyncio.to_thread(self._read_all)
+                self._cache = tuple(
+                    sorted(templates, key=lambda tpl: tpl.title.lower())
+                )
+                self._cache_stamp = stamp
+                self._by_id = {tpl.template_id: tpl for tpl in self._cache}
+            return self._cache
 
     async def get_template(self, template_id: str) -> SprintTemplate | None:
         """Return template by identifier or None if missing."""
 
-        templates = await self.list_templates()
-        for template in templates:
-            if template.template_id == template_id:
-                return template
-        return None
+        await self.list_templates()
+        return self._by_id.get(template_id)
 
     async def create_template(
         self,
@@ -289,6 +297,13 @@ class TemplateService:
 
     # --- internal helpers -------------------------------------------------
 
+    def _stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def _read_raw(self) -> list[dict] | None:
         if not self._path.exists():
             return None
@@ -307,6 +322,7 @@ class TemplateService:
         return [SprintTemplate.from_dict(item) for item in raw]
 
     def _write_all(self, templates: Iterable[SprintTemplate]) -> None:
+        self._cache = None
         payload = [template.to_dict() for template in templates]
         self._path.write_text(
             json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
@@ -53,6 +53,14 @@ def test_degradation_percent_cases() -> None:
     assert analytics.degradation_percent([30.0, 28.0], 25.0) == 0.0
 
 
+def test_speed_degradation_matches_split_based_value() -> None:
+    speeds = analytics.segment_speeds([30.0, 32.0], 25.0)
+    assert analytics.speed_degradation(speeds) == pytest.approx(
+        analytics.degradation_percent([30.0, 32.0], 25.0)
+    )
+    assert analytics.speed_degradation([1.5]) == 0.0
+
+
 def test_detect_total_pr_variations() -> None:
     result = analytics.detect_total_pr(65.0, 64.5)
     assert result.is_new and result.delta == pytest.approx(0.5)
@@ -0,0 +1,71 @@
+"""Tests for the registered athletes cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services import athletes_cache
+
+
+@pytest.fixture()
+def fetches(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[int]]:
+    calls: list[int] = []
+
+    def fake_fetch() -> list[tuple[int, str]]:
+        calls.append(1)
+        return athletes_cache.parse_athlete_records(
+            [["1", "Anna"], ["x", "Bad"], ["²", "Sup"], [], [" 2 "]]
+        )
+
+    athletes_cache.invalidate()
+    monkeypatch.setattr(athletes_cache, "_fetch_athletes", fake_fetch)
+    yield calls
+    athletes_cache.invalidate()
+
+
+async def test_get_athletes_reuses_cached_list(fetches: list[int]) -> None:
+    assert await athletes_cache.get_athletes() == [(1, "Anna"), (2, "2")]
+    assert await athletes_cache.get_athletes() == [(1, "Anna"), (2, "2")]
+    assert len(fetches) == 1
+
+
+async def test_invalidate_and_expiry_force_reload(fetches: list[int]) -> None:
+    await athletes_cache.get_athletes()
+    athletes_cache.invalidate()
+    await athletes_cache.get_athletes(ttl=0)
+    await athletes_cache.get_athletes()
+    assert len(fetches) == 3
+
+
+async def test_menu_sprint_acknowledges_before_loading(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import handlers.sprint_actions as sprint_actions
+
+    async def failing_get_athletes() -> list[tuple[int, str]]:
+        assert cb.answer.await_count == 1
+        raise RuntimeError("sheet unavailable")
+
+    cb = SimpleNamespace(
+        from_user=SimpleNamespace(id=1),
+        answer=AsyncMock(),
+        message=SimpleNamespace(answer=AsyncMock()),
+    )
+    monkeypatch.setattr(sprint_actions, "get_athletes", failing_get_athletes)
+
+    await sprint_actions.menu_sprint(cb, SimpleNamespace(), SimpleNamespace())
+
+    cb.message.answer.assert_awaited_once()
+
+
+def test_fetch_reads_raw_id_and_name_columns(monkeypatch: pytest.MonkeyPatch) -> None:
+    import services
+
+    worksheet = SimpleNamespace(get=lambda rng: {"A2:B": [["7", "Ira"]]}[rng])
+    monkeypatch.setattr(services, "get_athletes_worksheet", lambda: worksheet)
+
+    assert athletes_cache._fetch_athletes() == [(7, "Ira")]
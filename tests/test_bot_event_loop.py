@@ -0,0 +1,30 @@
+import asyncio
+
+import bot
+
+
+class _FakeUvloop:
+    class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+
+def test_install_event_loop_policy_without_uvloop(monkeypatch):
+    monkeypatch.setattr(bot, "uvloop", None)
+    assert bot.install_event_loop_policy() is False
+
+
+def test_install_event_loop_policy_respects_opt_out(monkeypatch):
+    monkeypatch.setattr(bot, "uvloop", _FakeUvloop)
+    monkeypatch.setenv("SPRINT_BOT_UVLOOP", "0")
+    assert bot.install_event_loop_policy() is False
+
+
+def test_install_event_loop_policy_uses_uvloop(monkeypatch):
+    previous = asyncio.get_event_loop_policy()
+    monkeypatch.setattr(bot, "uvloop", _FakeUvloop)
+    monkeypatch.delenv("SPRINT_BOT_UVLOOP", raising=False)
+    try:
+        assert bot.install_event_loop_policy() is True
+        assert isinstance(asyncio.get_event_loop_policy(), _FakeUvloop.EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(previous)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from handlers.search import SearchStates
+from utils.fsm import advance_state
+
+
+def _make_state(storage: Any) -> FSMContext:
+    key = StorageKey(bot_id=1, chat_id=7, user_id=7)
+    return FSMContext(storage=storage, key=key)
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, key: str, value: str, ex: Any = None) -> None:
+        self._ops.append(("set", (key, value)))
+
+    def delete(self, key: str) -> None:
+        self._ops.append(("delete", (key,)))
+
+    async def execute(self) -> None:
+        self._redis.executions += 1
+        for op, args in self._ops:
+            if op == "set":
+                self._redis.values[args[0]] = args[1]
+            else:
+                self._redis.values.pop(args[0], None)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.executions = 0
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+class _KeyBuilder:
+    @staticmethod
+    def build(key: StorageKey, part: str) -> str:
+        return f"fsm:{key.chat_id}:{key.user_id}:{part}"
+
+
+class _FakeRedisStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.redis = _FakeRedis()
+        self.key_builder = _KeyBuilder()
+        self.state_ttl = None
+        self.data_ttl = None
+
+    @staticmethod
+    def json_dumps(data: dict[str, Any]) -> str:
+        import json
+
+        return json.dumps(data)
+
+
+def test_advance_state_merges_data_and_sets_state() -> None:
+    async def scenario() -> None:
+        state = _make_state(MemoryStorage())
+        await state.update_data(athlete_id=1)
+        data = await advance_state(state, SearchStates.choose_style, stroke="freestyle")
+        assert data == {"athlete_id": 1, "stroke": "freestyle"}
+        assert await state.get_data() == data
+        assert await state.get_state() == SearchStates.choose_style.state
+
+    asyncio.run(scenario())
+
+
+def test_advance_state_uses_single_pipeline_for_redis() -> None:
+    async def scenario() -> None:
+        storage = _FakeRedisStorage()
+        state = _make_state(storage)
+        await advance_state(state, SearchStates.browsing, only_pr=True)
+        assert storage.redis.executions == 1
+        state_key = storage.key_builder.build(state.key, "state")
+        data_key = storage.key_builder.build(state.key, "data")
+        assert storage.redis.values[state_key] == SearchStates.browsing.state
+        assert storage.redis.values[data_key] == '{"only_pr": true}'
+
+    asyncio.run(scenario())
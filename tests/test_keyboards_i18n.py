@@ -2,9 +2,15 @@ from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup
 
 from i18n import reset_context_language, set_context_language
 from keyboards import (
+    AthleteSelectCB,
     build_main_reply_keyboard,
+    build_search_nav_row,
+    get_athlete_select_keyboard,
     get_distance_keyboard,
     get_main_keyboard,
+    get_template_keyboard,
+    pack_timestamp_for_callback,
+    unpack_timestamp_from_callback,
 )
 from role_service import ROLE_TRAINER
 
@@ -37,3 +43,55 @@ def test_keyboard_buttons_translate_between_languages() -> None:
     assert uk_reply != ru_reply
     assert uk_inline != ru_inline
     assert uk_distance != ru_distance
+
+
+def test_search_nav_row_is_cached_per_language() -> None:
+    uk_token = set_context_language("uk")
+    try:
+        uk_first = build_search_nav_row(2, 3)
+        uk_second = build_search_nav_row(2, 3)
+    finally:
+        reset_context_language(uk_token)
+
+    ru_token = set_context_language("ru")
+    try:
+        ru_row = build_search_nav_row(2, 3)
+    finally:
+        reset_context_language(ru_token)
+
+    assert len(uk_first) == 2
+    assert all(a is b for a, b in zip(uk_first, uk_second))
+    assert [b.text for b in uk_first] != [b.text for b in ru_row]
+    assert build_search_nav_row(1, 1) == []
+
+
+def test_athlete_select_keyboard_uses_two_columns_and_is_cached() -> None:
+    athletes = ((1, "Anna"), (2, "Bohdan"), (3, "Chris"))
+
+    markup = get_athlete_select_keyboard(athletes)
+
+    assert [len(row) for row in markup.inline_keyboard] == [2, 1]
+    assert markup.inline_keyboard[1][0].callback_data == "select:3"
+    assert AthleteSelectCB.unpack("select:3").athlete_id == 3
+    assert get_athlete_select_keyboard(athletes) is markup
+
+
+def test_packed_timestamps_round_trip_and_are_cached() -> None:
+    timestamp = "2024-01-02 10:00:00"
+
+    packed = pack_timestamp_for_callback(timestamp)
+
+    assert "=" not in packed
+    assert unpack_timestamp_from_callback(packed) == timestamp
+    assert pack_timestamp_for_callback(timestamp) is packed
+
+
+def test_template_keyboard_is_cached_per_template_set() -> None:
+    templates = [("50_free", "50 free"), ("100_free", "100 free")]
+
+    markup = get_template_keyboard(iter(templates))
+
+    assert [len(row) for row in markup.inline_keyboard] == [2, 1]
+    assert get_template_keyboard(templates) is markup
+    assert get_template_keyboard(templates[:1]) is not markup
+    assert get_distance_keyboard() is get_distance_keyboard()
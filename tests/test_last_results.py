@@ -0,0 +1,124 @@
+"""Quick-repeat cache kept by sprint handlers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+
+import handlers.sprint_actions as sprint_actions
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(sprint_actions, "LAST_RESULTS", OrderedDict())
+    monkeypatch.setattr(sprint_actions, "LAST_BY_TS", {})
+    yield
+
+
+def _payload(timestamp: str) -> dict[str, Any]:
+    return {"athlete_id": 1, "timestamp": timestamp, "comment": ""}
+
+
+def test_sync_updates_payloads_sharing_timestamp() -> None:
+    sprint_actions._remember_last_result((10, 1), _payload("t1"))
+    sprint_actions._remember_last_result((11, 1), _payload("t1"))
+    sprint_actions._remember_last_result((12, 2), _payload("t2"))
+
+    sprint_actions._sync_last_results("t1", "note")
+
+    comments = {
+        key: payload["comment"] for key, payload in sprint_actions.LAST_RESULTS.items()
+    }
+    assert comments == {(10, 1): "note", (11, 1): "note", (12, 2): ""}
+
+
+def test_replaced_payload_leaves_timestamp_index() -> None:
+    sprint_actions._remember_last_result((10, 1), _payload("t1"))
+    sprint_actions._remember_last_result((10, 1), _payload("t2"))
+
+    assert "t1" not in sprint_actions.LAST_BY_TS
+    assert sprint_actions.LAST_BY_TS["t2"] == [sprint_actions.LAST_RESULTS[(10, 1)]]
+
+
+def test_cache_evicts_least_recent_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sprint_actions, "LAST_RESULTS_LIMIT", 2)
+
+    sprint_actions._remember_last_result((1, 1), _payload("t1"))
+    sprint_actions._remember_last_result((2, 1), _payload("t2"))
+    sprint_actions._remember_last_result((1, 1), _payload("t3"))
+    sprint_actions._remember_last_result((3, 1), _payload("t4"))
+
+    assert list(sprint_actions.LAST_RESULTS) == [(1, 1), (3, 1)]
+    assert sorted(sprint_actions.LAST_BY_TS) == ["t3", "t4"]
+
+
+def _stats() -> dict[str, Any]:
+    return {
+        "new_total_pr": False,
+        "total_pr_delta": 0.0,
+        "previous_total": 61.0,
+        "segment_prs": [False, False],
+        "sob_delta": 0.0,
+        "sob_previous": 60.0,
+        "sob_current": 60.0,
+    }
+
+
+async def _repeat(monkeypatch: pytest.MonkeyPatch, timestamp: str) -> None:
+    monkeypatch.setattr(
+        sprint_actions,
+        "_persist_result",
+        lambda *args, **kwargs: (61.0, [], timestamp, _stats()),
+    )
+    cb = SimpleNamespace(
+        from_user=SimpleNamespace(id=10, full_name="Coach"),
+        message=SimpleNamespace(answer=AsyncMock()),
+        answer=AsyncMock(),
+    )
+    role_service = SimpleNamespace(trainers_for_athlete=AsyncMock(return_value=()))
+    notifications = SimpleNamespace(notify_new_result=AsyncMock())
+    await sprint_actions.repeat_previous(
+        cb, sprint_actions.RepeatCB(athlete_id=1), notifications, role_service
+    )
+
+
+def _saved_payload(timestamp: str) -> dict[str, Any]:
+    return {
+        "athlete_id": 1,
+        "athlete_name": "Athlete",
+        "stroke": "freestyle",
+        "dist": 100,
+        "splits": [30.0, 31.0],
+        "timestamp": timestamp,
+        "comment": "old",
+    }
+
+
+async def test_repeated_result_comment_reaches_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sprint_actions._remember_last_result((10, 1), _saved_payload("T0"))
+
+    await _repeat(monkeypatch, "T1")
+    sprint_actions._sync_last_results("T1", "new comment")
+
+    payload = sprint_actions.LAST_RESULTS[(10, 1)]
+    assert payload["timestamp"] == "T1"
+    assert payload["comment"] == "new comment"
+    assert "T0" not in sprint_actions.LAST_BY_TS
+
+
+async def test_repeats_leave_one_timestamp_bucket(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sprint_actions._remember_last_result((10, 1), _saved_payload("T0"))
+
+    for timestamp in ("T1", "T2", "T3"):
+        await _repeat(monkeypatch, timestamp)
+
+    payload = sprint_actions.LAST_RESULTS[(10, 1)]
+    assert sprint_actions.LAST_BY_TS == {"T3": [payload]}
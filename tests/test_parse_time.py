@@ -2,6 +2,7 @@ import math
 
 import pytest
 
+from utils import get_segments, sheet_float
 from utils.parse_time import (
     ParseTimeError,
     ParseTimeErrorCode,
@@ -92,3 +93,15 @@ def test_validate_splits_negative_tolerance() -> None:
     with pytest.raises(ParseTimeError) as exc:
         validate_splits(58.6, [30.0, 28.7], tol=-0.1)
     assert exc.value.code is ParseTimeErrorCode.INVALID_INPUT
+
+
+def test_sheet_float_accepts_decimal_comma() -> None:
+    assert sheet_float("61,25") == 61.25
+    assert sheet_float("61.5") == 61.5
+    assert sheet_float(60) == 60.0
+
+
+def test_get_segments_is_cached_and_immutable() -> None:
+    assert get_segments(100) == (25.0, 25.0, 25.0, 25.0)
+    assert get_segments(400) is get_segments(400)
+    assert get_segments(75) == (75.0,)
@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-from role_service import ROLE_ATHLETE, ROLE_TRAINER, RoleService
+import pytest
+
+from role_service import ROLE_ADMIN, ROLE_ATHLETE, ROLE_TRAINER, RoleService
 
 
 def test_trainer_access_requires_assignment(tmp_path: Path) -> None:
@@ -57,3 +59,74 @@ def test_get_accessible_athletes_for_trainer(tmp_path: Path) -> None:
         assert await service.get_accessible_athletes(unassigned_trainer) == ()
 
     asyncio.run(scenario())
+
+
+def test_bulk_sync_athletes_skips_unchanged_records(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def scenario() -> None:
+        service = RoleService(tmp_path / "roles.db")
+        await service.init()
+        writes: list[int] = []
+        original = service._bulk_sync_athletes
+
+        def counting_sync(records):  # type: ignore[no-untyped-def]
+            writes.append(len(records))
+            original(records)
+
+        monkeypatch.setattr(service, "_bulk_sync_athletes", counting_sync)
+
+        records = [(100, "Anna"), (101, "Bohdan")]
+        await service.bulk_sync_athletes(records)
+        await service.bulk_sync_athletes(records)
+        await service.bulk_sync_athletes([(100, "Anna"), (101, "Bohdan K")])
+
+        users = {
+            user.telegram_id: user.full_name for user in await service.list_users()
+        }
+        assert users == {100: "Anna", 101: "Bohdan K"}
+        assert writes == [2, 2]
+
+    asyncio.run(scenario())
+
+
+def test_get_role_and_accessible_matches_role(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        service = RoleService(tmp_path / "roles.db")
+        await service.init(admin_ids=(1,))
+        await service.bulk_sync_athletes([(100, "Anna"), (101, "Bohdan")])
+        await service.set_role(200, ROLE_TRAINER)
+        await service.set_trainer(101, 200)
+
+        assert await service.get_role_and_accessible(1) == (ROLE_ADMIN, (100, 101))
+        assert await service.get_role_and_accessible(200) == (ROLE_TRAINER, (101,))
+        assert await service.get_role_and_accessible(100) == (ROLE_ATHLETE, (100,))
+
+    asyncio.run(scenario())
+
+
+def test_can_access_athlete_caches_until_assignment_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def scenario() -> None:
+        service = RoleService(tmp_path / "roles.db")
+        await service.init()
+        await service.set_role(200, ROLE_TRAINER)
+        lookups: list[int] = []
+        original = service._athletes_for_trainer
+
+        def counting_lookup(trainer_id: int):  # type: ignore[no-untyped-def]
+            lookups.append(trainer_id)
+            return original(trainer_id)
+
+        monkeypatch.setattr(service, "_athletes_for_trainer", counting_lookup)
+
+        assert not await service.can_access_athlete(200, 100)
+        assert not await service.can_access_athlete(200, 100)
+        assert lookups == [200]
+
+        await service.set_trainer(100, 200)
+        assert await service.can_access_athlete(200, 100)
+        assert lookups == [200, 200]
+
+    asyncio.run(scenario())
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import sqlite3
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Sequence
@@ -14,6 +14,7 @@ from aiogram.fsm.storage.memory import MemoryStorage
 
 from handlers.search import (
     SearchStates,
+    _can_have_results,
     input_dates,
     paginate,
     select_athlete,
@@ -294,3 +295,57 @@ def test_search_wizard_flow() -> None:
         nav_cb.message.edit_text.assert_called_once()
 
     asyncio.run(scenario())
+
+
+def test_select_pr_skips_query_for_future_dates() -> None:
+    async def scenario() -> None:
+        state = _make_state()
+        await start_search(DummyMessage(text="/search"), state, FakeRoleService())
+        await state.update_data(date_from="2999-01-01", date_to="2999-02-01")
+        await state.set_state(SearchStates.choose_pr)
+        query_service = FakeQueryService({})
+
+        message = DummyMessage()
+        await select_pr(
+            DummyCallback(message),
+            state,
+            SearchFilterCB(field="pr", value="all"),
+            query_service,
+        )
+
+        assert query_service.calls == []
+        message.answer.assert_awaited_once_with(t("search.empty"))
+        assert await state.get_state() == SearchStates.browsing.state
+
+    asyncio.run(scenario())
+
+
+def test_select_pr_skips_query_for_inaccessible_athlete() -> None:
+    async def scenario() -> None:
+        state = _make_state()
+        await start_search(DummyMessage(text="/search"), state, FakeRoleService())
+        await state.update_data(athlete_id=42)
+        await state.set_state(SearchStates.choose_pr)
+        query_service = FakeQueryService({})
+
+        message = DummyMessage()
+        await select_pr(
+            DummyCallback(message),
+            state,
+            SearchFilterCB(field="pr", value="only"),
+            query_service,
+        )
+
+        assert query_service.calls == []
+        message.answer.assert_awaited_once_with(t("search.empty"))
+
+    asyncio.run(scenario())
+
+
+def test_can_have_results_uses_utc_today() -> None:
+    today = datetime.now(timezone.utc).date()
+
+    assert _can_have_results(SearchFilters(date_from=today, date_to=today), {})
+    assert not _can_have_results(
+        SearchFilters(date_from=date(2999, 1, 1), date_to=date(2999, 2, 1)), {}
+    )
@@ -0,0 +1,63 @@
+"""Tests for cached worksheet snapshots."""
+
+from __future__ import annotations
+
+from services.sheet_cache import SheetSnapshot, appended_row
+
+
+class _Sheet:
+    def __init__(self, rows: list[list[str]]) -> None:
+        self.rows = rows
+        self.reads = 0
+
+    def get_all_values(self) -> list[list[str]]:
+        self.reads += 1
+        return [list(row) for row in self.rows]
+
+
+def test_appended_row_parses_updated_range() -> None:
+    assert appended_row({"updates": {"updatedRange": "pr!A7:C9"}}) == 7
+    assert appended_row(None) is None
+    assert appended_row({"updates": {}}) is None
+
+
+def test_snapshot_mirrors_writes_without_reloading() -> None:
+    sheet = _Sheet([["a", "1"]])
+    snapshot = SheetSnapshot(lambda: sheet)
+
+    snapshot.rows()
+    snapshot.record_append([["b", 2]], {"updates": {"updatedRange": "s!A2:B2"}})
+    snapshot.record_update(1, ["a", 3])
+    snapshot.record_cell(2, 4, "note")
+
+    assert snapshot.rows() == [["a", "3"], ["b", "2", "", "note"]]
+    assert sheet.reads == 1
+
+
+def test_snapshot_reloads_after_mismatch_or_expiry() -> None:
+    sheet = _Sheet([["a"]])
+    snapshot = SheetSnapshot(lambda: sheet)
+
+    snapshot.rows()
+    snapshot.record_append([["b"]], {"updates": {"updatedRange": "s!A5:A5"}})
+    snapshot.rows()
+    assert sheet.reads == 2
+
+    expired = SheetSnapshot(lambda: sheet, ttl=-1)
+    expired.rows()
+    expired.rows()
+    assert sheet.reads == 4
+
+
+def test_index_tracks_mirrored_writes() -> None:
+    sheet = _Sheet([["x", "1"], ["y", "2"], ["bad"]])
+    snapshot = SheetSnapshot(lambda: sheet)
+    index = snapshot.index(lambda row: (row[0], int(row[1])))
+
+    assert index.get("x") == {1: 1}
+    snapshot.record_append([["x", 5]])
+    snapshot.record_update(2, ["x", 7])
+
+    assert index.get("x") == {1: 1, 2: 7, 4: 5}
+    assert index.get("y") == {}
+    assert sheet.reads == 1
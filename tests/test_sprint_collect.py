@@ -0,0 +1,45 @@
+"""Split collection flow in sprint result handlers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from handlers.sprint_actions import collect, stroke_chosen
+from keyboards import StrokeCB
+from utils import AddResult
+
+
+def _make_state() -> FSMContext:
+    storage = MemoryStorage()
+    key = StorageKey(bot_id=1, chat_id=24, user_id=42)
+    return FSMContext(storage=storage, key=key)
+
+
+def _message(text: str = "") -> SimpleNamespace:
+    return SimpleNamespace(text=text, answer=AsyncMock(), reply=AsyncMock())
+
+
+async def test_collect_walks_segments_and_waits_for_comment() -> None:
+    state = _make_state()
+    await state.update_data(dist=50, splits=[], idx=0, segments=[25, 25])
+    cb = SimpleNamespace(message=_message(), answer=AsyncMock())
+
+    await stroke_chosen(cb, StrokeCB(stroke="freestyle"), state)
+    data = await state.get_data()
+    assert await state.get_state() == AddResult.collect.state
+    assert data["segments"] == [25.0, 25.0]
+    assert data["stroke"] == "freestyle"
+
+    await collect(_message("0:15.00"), state)
+    assert (await state.get_data())["idx"] == 1
+    assert await state.get_state() == AddResult.collect.state
+
+    await collect(_message("0:16.00"), state)
+    data = await state.get_data()
+    assert data["splits"] == [15.0, 16.0]
+    assert await state.get_state() == AddResult.waiting_for_comment.state
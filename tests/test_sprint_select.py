@@ -0,0 +1,85 @@
+"""Athlete selection step of the sprint result wizard."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from handlers.sprint_actions import select_athlete
+from keyboards import AthleteSelectCB
+from role_service import ROLE_TRAINER
+from utils import AddResult
+
+
+def _make_state() -> FSMContext:
+    storage = MemoryStorage()
+    key = StorageKey(bot_id=1, chat_id=7, user_id=7)
+    return FSMContext(storage=storage, key=key)
+
+
+def _callback() -> SimpleNamespace:
+    return SimpleNamespace(
+        from_user=SimpleNamespace(id=7),
+        answer=AsyncMock(),
+        message=SimpleNamespace(answer=AsyncMock()),
+    )
+
+
+async def test_select_athlete_uses_ids_offered_by_menu() -> None:
+    state = _make_state()
+    await state.update_data(selectable_athletes=[1, 2])
+    role_service = SimpleNamespace(can_access_athlete=AsyncMock())
+    cb = _callback()
+
+    await select_athlete(cb, AthleteSelectCB(athlete_id=2), state, role_service)
+
+    role_service.can_access_athlete.assert_not_awaited()
+    assert (await state.get_data())["athlete_id"] == 2
+    assert await state.get_state() == AddResult.choose_dist.state
+
+    cb = _callback()
+    await select_athlete(cb, AthleteSelectCB(athlete_id=3), state, role_service)
+    cb.answer.assert_awaited_once()
+    assert (await state.get_data())["athlete_id"] == 2
+
+
+async def test_select_athlete_falls_back_to_role_check() -> None:
+    state = _make_state()
+    role_service = SimpleNamespace(can_access_athlete=AsyncMock(return_value=False))
+    cb = _callback()
+
+    await select_athlete(cb, AthleteSelectCB(athlete_id=5), state, role_service)
+
+    role_service.can_access_athlete.assert_awaited_once_with(7, 5)
+    assert await state.get_state() is None
+
+
+async def test_menu_sprint_offers_only_assigned_athletes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import handlers.sprint_actions as sprint_actions
+
+    async def fake_get_athletes() -> list[tuple[int, str]]:
+        return [(1, "Anna"), (2, "Bohdan")]
+
+    monkeypatch.setattr(sprint_actions, "get_athletes", fake_get_athletes)
+    role_service = SimpleNamespace(
+        bulk_sync_athletes=AsyncMock(),
+        get_role_and_accessible=AsyncMock(return_value=(ROLE_TRAINER, (2,))),
+    )
+    state = _make_state()
+    cb = _callback()
+
+    await sprint_actions.menu_sprint(cb, state, role_service)
+
+    role_service.bulk_sync_athletes.assert_awaited_once_with(
+        [(1, "Anna"), (2, "Bohdan")]
+    )
+    assert (await state.get_data())["selectable_athletes"] == [2]
+    assert await state.get_state() == AddResult.choose_athlete.state
@@ -0,0 +1,365 @@
+"""Google Sheets access patterns used by sprint result handlers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+import handlers.sprint_actions as sprint_actions
+
+
+class FakeWorksheet:
+    """Minimal worksheet double that records API usage."""
+
+    def __init__(self, title: str, rows: list[list[Any]] | None = None) -> None:
+        self.title = title
+        self.rows: list[list[str]] = [[str(v) for v in row] for row in rows or []]
+        self.calls: list[str] = []
+
+    def get_all_values(self) -> list[list[str]]:
+        self.calls.append("get_all_values")
+        return [list(row) for row in self.rows]
+
+    def append_row(self, row: list[Any], **kwargs: Any) -> dict[str, Any]:
+        self.calls.append("append_row")
+        self.rows.append([str(v) for v in row])
+        idx = len(self.rows)
+        return {"updates": {"updatedRange": f"{self.title}!A{idx}:H{idx}"}}
+
+    def update(self, range_name: str, values: list[list[Any]], **kwargs: Any) -> None:
+        self.calls.append("update")
+        row_idx = int(range_name.split(":")[0][1:])
+        self.rows[row_idx - 1] = [str(v) for v in values[0]]
+
+    def append_rows(self, rows: list[list[Any]], **kwargs: Any) -> dict[str, Any]:
+        self.calls.append("append_rows")
+        start = len(self.rows) + 1
+        self.rows.extend([str(v) for v in row] for row in rows)
+        end = len(self.rows)
+        return {"updates": {"updatedRange": f"{self.title}!A{start}:H{end}"}}
+
+    def batch_update(self, data: list[dict[str, Any]], **kwargs: Any) -> None:
+        self.calls.append("batch_update")
+        for entry in data:
+            row_idx = int(entry["range"].split(":")[0][1:])
+            self.rows[row_idx - 1] = [str(v) for v in entry["values"][0]]
+
+    def update_cell(self, row: int, col: int, value: Any) -> None:
+        self.calls.append("update_cell")
+        target = self.rows[row - 1]
+        target.extend([""] * (col - len(target)))
+        target[col - 1] = str(value)
+
+
+@pytest.fixture()
+def sheets(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[str, FakeWorksheet]]:
+    worksheets = {
+        "results": FakeWorksheet(
+            "results",
+            [
+                ["ID", "Name", "Stroke", "Dist", "Timestamp", "Splits", "Total"],
+                [1, "Athlete", "freestyle", 100, "2024-01-01 10:00:00", "[30, 31]", 61],
+            ],
+        ),
+        "pr": FakeWorksheet("pr"),
+        "log": FakeWorksheet("log"),
+    }
+    monkeypatch.setattr(sprint_actions, "_results_sheet", lambda: worksheets["results"])
+    monkeypatch.setattr(sprint_actions, "_pr_sheet", lambda: worksheets["pr"])
+    monkeypatch.setattr(sprint_actions, "_log_sheet", lambda: worksheets["log"])
+    sprint_actions._RESULTS_SNAPSHOT.invalidate()
+    sprint_actions._PR_SNAPSHOT.invalidate()
+    yield worksheets
+    sprint_actions._LOG_WRITER.submit(lambda: None).result()
+    sprint_actions._RESULTS_SNAPSHOT.invalidate()
+    sprint_actions._PR_SNAPSHOT.invalidate()
+
+
+def test_find_result_row_uses_cached_index(sheets: dict[str, FakeWorksheet]) -> None:
+    results = sheets["results"]
+
+    assert sprint_actions._find_result_row(1, "2024-01-01 10:00:00") == 2
+    assert sprint_actions._find_result_row(1, "2024-01-01 10:00:00") == 2
+    assert results.calls.count("get_all_values") == 1
+
+    with pytest.raises(ValueError):
+        sprint_actions._find_result_row(2, "2024-01-01 10:00:00")
+    assert results.calls.count("get_all_values") == 1
+
+
+def test_persisted_result_is_indexed_without_rescan(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    results = sheets["results"]
+    sprint_actions._find_result_row(1, "2024-01-01 10:00:00")
+
+    _, _, timestamp, _ = sprint_actions._persist_result(
+        1, "Athlete", "freestyle", 100, [29.0, 30.0]
+    )
+    reads = results.calls.count("get_all_values")
+
+    assert sprint_actions._find_result_row(1, timestamp) == 3
+    assert results.calls.count("get_all_values") == reads
+    sprint_actions._LOG_WRITER.submit(lambda: None).result()
+    assert results.rows[2][5] == sheets["log"].rows[0][3] == "[29.0,30.0]"
+
+
+def test_segment_prs_are_written_in_one_batch(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    pr = sheets["pr"]
+    pr.rows = [
+        ["1|freestyle|100|0", "15.0", "2024-01-01 10:00:00"],
+        ["1|freestyle|100|1", "15.5", "2024-01-01 10:00:00"],
+    ]
+
+    _, new_prs, _, _ = sprint_actions._persist_result(
+        1, "Athlete", "freestyle", 100, [14.5, 15.2, 15.0, 15.1]
+    )
+
+    assert [idx for idx, _ in new_prs] == [0, 1, 2, 3]
+    writes = [call for call in pr.calls if call != "get_all_values"]
+    assert writes == ["batch_update", "append_rows"]
+    assert [row[0] for row in pr.rows] == [
+        "1|freestyle|100|0",
+        "1|freestyle|100|1",
+        "1|freestyle|100|2",
+        "1|freestyle|100|3",
+    ]
+    assert pr.rows[0][1] == "14.5"
+
+
+def test_consecutive_saves_reuse_sheet_snapshots(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    results, pr = sheets["results"], sheets["pr"]
+
+    sprint_actions._persist_result(1, "Athlete", "freestyle", 100, [29.0, 30.0])
+    _, new_prs, _, stats = sprint_actions._persist_result(
+        1, "Athlete", "freestyle", 100, [28.5, 31.0]
+    )
+
+    assert results.calls.count("get_all_values") == 1
+    assert pr.calls.count("get_all_values") == 1
+    assert new_prs == [(0, 28.5)]
+    assert stats["previous_total"] == 59.0
+
+
+def test_best_lookups_only_touch_matching_athlete(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    results = sheets["results"]
+    results.rows.append(["2", "Other", "freestyle", "100", "t", "[20, 20]", "40"])
+    sheets["pr"].rows = [
+        ["2|freestyle|100|0", "10.0", "t"],
+        ["1|freestyle|100|0", "30.0", "t"],
+        ["1|butterfly|100|0", "20.0", "t"],
+    ]
+
+    assert sprint_actions._load_best_total(1, "freestyle", 100) == 61.0
+    assert sprint_actions._load_best_total(3, "freestyle", 100) is None
+    assert sprint_actions._load_segment_bests(1, "freestyle", 100) == ([30.0], {0: 2})
+
+
+async def test_history_reads_cached_rows_newest_first(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    results = sheets["results"]
+    results.rows.append(
+        ["1", "Athlete", "freestyle", "50", "2024-01-02 10:00:00", "[30.5]", "30.5"]
+    )
+    answers: list[str] = []
+
+    async def answer(text: str, **kwargs: Any) -> None:
+        answers.append(text)
+
+    cb = SimpleNamespace(
+        from_user=SimpleNamespace(id=1),
+        message=SimpleNamespace(answer=answer),
+        answer=AsyncMock(),
+    )
+
+    await sprint_actions.history(cb)
+    await sprint_actions.history(cb)
+
+    assert cb.answer.await_count == 2
+    assert results.calls.count("get_all_values") == 1
+    assert answers[0].index("2024-01-02") < answers[0].index("2024-01-01")
+
+
+async def test_cmd_results_lists_latest_five_newest_first(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    results = sheets["results"]
+    for day in range(2, 9):
+        results.rows.append(
+            [
+                "1",
+                "Athlete",
+                "freestyle",
+                "50",
+                f"2024-01-0{day} 10:00:00",
+                "[30]",
+                "30",
+            ]
+        )
+    message = SimpleNamespace(from_user=SimpleNamespace(id=1), answer=AsyncMock())
+
+    await sprint_actions.cmd_results(message)
+
+    text = message.answer.await_args.args[0]
+    assert text.index("2024-01-08") < text.index("2024-01-04")
+    assert "2024-01-03" not in text
+
+
+async def test_finalize_saves_off_loop_and_notifies_trainers(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    state = FSMContext(
+        storage=MemoryStorage(), key=StorageKey(bot_id=1, chat_id=1, user_id=1)
+    )
+    await state.update_data(dist=50, stroke="freestyle", splits=[30.0])
+    target = SimpleNamespace(answer=AsyncMock())
+    actor = SimpleNamespace(id=1, full_name="Athlete")
+    role_service = SimpleNamespace(trainers_for_athlete=AsyncMock(return_value=[7]))
+    notifications = SimpleNamespace(notify_new_result=AsyncMock())
+
+    await sprint_actions._finalize_result_entry(
+        target, actor, state, None, notifications, role_service
+    )
+
+    assert sheets["results"].calls.count("append_row") == 1
+    target.answer.assert_awaited_once()
+    kwargs = notifications.notify_new_result.await_args.kwargs
+    assert kwargs["trainers"] == [7]
+    assert kwargs["total"] == 30.0
+
+
+async def test_records_and_results_reuse_cached_rows(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    sheets["pr"].rows = [
+        ["1|freestyle|50|0", "15.0", "t"],
+        ["1|freestyle|50|1", "16,5", "t"],
+        ["2|freestyle|50|0", "14.0", "t"],
+    ]
+    message = SimpleNamespace(answer=AsyncMock())
+    cb = SimpleNamespace(
+        from_user=SimpleNamespace(id=1), message=message, answer=AsyncMock()
+    )
+
+    await sprint_actions.records(cb)
+    await sprint_actions.records(cb)
+    await sprint_actions.cmd_results(
+        SimpleNamespace(from_user=cb.from_user, answer=AsyncMock())
+    )
+
+    assert "31.50" in message.answer.await_args_list[0].args[0]
+    assert sheets["pr"].calls.count("get_all_values") == 1
+    assert sheets["results"].calls.count("get_all_values") == 1
+
+
+def test_message_chunks_split_on_block_boundaries() -> None:
+    blocks = ["a" * 6, "b" * 6, "c" * 20]
+
+    chunks = sprint_actions._message_chunks(blocks, limit=14)
+
+    assert chunks == ["aaaaaa\n\nbbbbbb", "c" * 20]
+    assert sprint_actions._message_chunks([]) == []
+
+
+def test_read_comment_uses_cached_rows(sheets: dict[str, FakeWorksheet]) -> None:
+    results = sheets["results"]
+    results.rows.append(
+        ["1", "Athlete", "freestyle", "50", "2024-01-02 10:00:00", "[30]", "30", "ok"]
+    )
+
+    assert sprint_actions._read_comment(3) == "ok"
+    assert sprint_actions._read_comment(2) == ""
+    assert results.calls == ["get_all_values"]
+
+
+async def test_history_skips_malformed_rows_whole(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    sheets["results"].rows.append(
+        ["1", "Athlete", "freestyle", "50", "2024-01-02 10:00:00", '[30, "x"]', "30"]
+    )
+    message = SimpleNamespace(answer=AsyncMock())
+    cb = SimpleNamespace(
+        from_user=SimpleNamespace(id=1), message=message, answer=AsyncMock()
+    )
+
+    await sprint_actions.history(cb)
+
+    text = message.answer.await_args.args[0]
+    assert "2024-01-02" not in text
+    assert text.startswith("<b>2024-01-01 10:00:00 | 100")
+    assert text.endswith(sprint_actions.HISTORY_SEPARATOR)
+
+
+async def test_history_uses_owner_index_and_mirrored_appends(
+    sheets: dict[str, FakeWorksheet],
+) -> None:
+    sheets["results"].rows.append(
+        ["2", "Other", "freestyle", "50", "2024-01-03 10:00:00", "[29]", "29"]
+    )
+    message = SimpleNamespace(answer=AsyncMock())
+    cb = SimpleNamespace(
+        from_user=SimpleNamespace(id=1), message=message, answer=AsyncMock()
+    )
+
+    await sprint_actions.history(cb)
+    sprint_actions._RESULTS_SNAPSHOT.record_append(
+        [[1, "Athlete", "freestyle", 50, "2024-01-04 10:00:00", "[28]", 28]]
+    )
+    await sprint_actions.history(cb)
+
+    text = message.answer.await_args.args[0]
+    assert "2024-01-03" not in text
+    assert text.index("2024-01-04") < text.index("2024-01-01")
+    assert sheets["results"].calls == ["get_all_values"]
+
+
+async def test_warm_caches_preloads_snapshots(
+    sheets: dict[str, FakeWorksheet], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    athletes = AsyncMock(return_value=[(1, "Athlete")])
+    monkeypatch.setattr(sprint_actions, "get_athletes", athletes)
+
+    await sprint_actions.warm_caches()
+    sprint_actions._RESULTS_SNAPSHOT.rows()
+    sprint_actions._PR_SNAPSHOT.rows()
+
+    athletes.assert_awaited_once()
+    assert sheets["results"].calls == ["get_all_values"]
+    assert sheets["pr"].calls == ["get_all_values"]
+
+
+async def test_warm_caches_logs_failures(
+    sheets: dict[str, FakeWorksheet], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        sprint_actions, "get_athletes", AsyncMock(side_effect=RuntimeError("down"))
+    )
+
+    await sprint_actions.warm_caches()
+
+    assert sheets["results"].calls == ["get_all_values"]
+
+
+async def test_reply_failure_still_awaits_notification() -> None:
+    notify = AsyncMock()
+
+    async def failing_reply() -> None:
+        raise RuntimeError("telegram down")
+
+    await sprint_actions._reply_and_notify(failing_reply(), notify())
+
+    notify.assert_awaited_once()
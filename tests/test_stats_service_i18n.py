@@ -17,6 +17,8 @@ from utils import fmt_time
 def format_result_summary(monkeypatch: pytest.MonkeyPatch):
     """Provide summary formatter with stubbed service dependencies."""
 
+    athletes_cache = importlib.import_module("services.athletes_cache")
+    sheet_cache = importlib.import_module("services.sheet_cache")
     services_stub = types.ModuleType("services")
     services_stub.__path__ = []  # mark as package for submodule imports
 
@@ -32,6 +34,8 @@ def format_result_summary(monkeypatch: pytest.MonkeyPatch):
     services_stub.get_pr_worksheet = lambda: empty_sheet
     services_stub.get_results_worksheet = lambda: empty_sheet
     monkeypatch.setitem(sys.modules, "services", services_stub)
+    monkeypatch.setitem(sys.modules, "services.athletes_cache", athletes_cache)
+    monkeypatch.setitem(sys.modules, "services.sheet_cache", sheet_cache)
 
     stats_stub = types.ModuleType("services.stats_service")
 
@@ -0,0 +1,39 @@
+"""Template storage caching."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from template_service import TemplateService
+
+
+async def test_list_templates_rereads_only_after_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "templates.json"
+    service = TemplateService(storage_path=path)
+    await service.init()
+    reads: list[int] = []
+    original = service._read_all
+
+    def counting_read():  # type: ignore[no-untyped-def]
+        reads.append(1)
+        return original()
+
+    monkeypatch.setattr(service, "_read_all", counting_read)
+
+    first = await service.list_templates()
+    assert await service.list_templates() is first
+    assert await service.get_template("50_free") is not None
+    assert len(reads) == 1
+
+    path.write_text(
+        json.dumps([{"template_id": "x", "title": "X", "dist": 50}]),
+        encoding="utf-8",
+    )
+    assert [tpl.template_id for tpl in await service.list_templates()] == ["x"]
+    assert await service.get_template("50_free") is None
+    assert len(reads) == 2
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from aiogram.fsm.state import State, StatesGroup
 
 from .parse_time import (
@@ -22,6 +24,7 @@ __all__ = [
     "parse_splits",
     "parse_total",
     "pr_key",
+    "sheet_float",
     "speed",
     "validate_splits",
 ]
@@ -55,29 +58,39 @@ class TemplateStates(StatesGroup):
 # --- Utility Functions ---
 
 
+@lru_cache(maxsize=4096)
 def fmt_time(seconds: float) -> str:
-    """Format seconds into a string like 1:23.45."""
+    """Format seconds into a string like 1:23.45.
+
+    Results are memoised because history and record listings format the
+    same recurring split values many times.
+    """
 
     m, s = divmod(seconds, 60)
     return f"{int(m)}:{s:05.2f}" if m else f"{s:.2f}"
 
 
-def get_segments(dist: int) -> list[float]:
-    """Calculate segment lengths for sprint analysis."""
+@lru_cache(maxsize=64)
+def get_segments(dist: int) -> tuple[float, ...]:
+    """Calculate segment lengths for sprint analysis.
+
+    The result is cached per distance and therefore immutable; callers that
+    need to modify it should copy it into a list first.
+    """
 
     if dist == 50:
         # 50м - это 4 сегмента по 12.5м для детального анализа
-        return [12.5, 12.5, 12.5, 12.5]
+        return (12.5, 12.5, 12.5, 12.5)
     if dist == 100:
         # Сотка - это классические 4 по 25м
-        return [25.0, 25.0, 25.0, 25.0]
+        return (25.0, 25.0, 25.0, 25.0)
     if dist >= 200:
         # 200м и длиннее - анализируем по "полтинникам"
         num_segments = dist // 50
-        return [50.0] * num_segments
+        return (50.0,) * num_segments
 
     # На случай, если дистанция не стандартная (например, 75м)
-    return [float(dist)]
+    return (float(dist),)
 
 
 def pr_key(uid: int, stroke: str, dist: int, seg_idx: int) -> str:
@@ -86,6 +99,17 @@ def pr_key(uid: int, stroke: str, dist: int, seg_idx: int) -> str:
     return f"{uid}|{stroke}|{dist}|{seg_idx}"
 
 
+def sheet_float(value: object) -> float:
+    """Parse a worksheet number that may use a decimal comma."""
+
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = value if isinstance(value, str) else str(value)
+    if "," in text:
+        text = text.replace(",", ".")
+    return float(text)
+
+
 def speed(dist: float, time: float) -> float:
     """Calculate speed in m/s."""
 
@@ -0,0 +1,59 @@
+"""Helpers for FSM state transitions."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StateType
+
+
+def _state_value(next_state: StateType) -> str | None:
+    if isinstance(next_state, State):
+        return next_state.state
+    return next_state
+
+
+async def _advance_pipelined(
+    state: FSMContext, next_state: StateType, data: dict[str, Any]
+) -> None:
+    """Write data and state with a single ``MULTI/EXEC`` round-trip."""
+
+    storage: Any = state.storage
+    data_key = storage.key_builder.build(state.key, "data")
+    state_key = storage.key_builder.build(state.key, "state")
+    value = _state_value(next_state)
+    async with storage.redis.pipeline(transaction=True) as pipe:
+        if data:
+            pipe.set(data_key, storage.json_dumps(data), ex=storage.data_ttl)
+        else:
+            pipe.delete(data_key)
+        if value is None:
+            pipe.delete(state_key)
+        else:
+            pipe.set(state_key, value, ex=storage.state_ttl)
+        await pipe.execute()
+
+
+async def advance_state(
+    state: FSMContext, next_state: StateType, **updates: Any
+) -> dict[str, Any]:
+    """Merge ``updates`` into FSM data and switch to ``next_state``.
+
+    Redis-backed storages receive both writes in one pipeline; other storages
+    fall back to ``set_data`` followed by ``set_state``.
+    """
+
+    data = await state.get_data()
+    data.update(updates)
+    storage = state.storage
+    if hasattr(storage, "redis") and hasattr(storage, "key_builder"):
+        await _advance_pipelined(state, next_state, data)
+    else:
+        await state.set_data(data)
+        await state.set_state(next_state)
+    return data
+
+
+__all__ = ["advance_state"]